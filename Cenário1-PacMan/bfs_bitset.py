@@ -0,0 +1,204 @@
+import sys
+from array import array
+
+from solver import GridState, MOTORES, BRANCO, PRETO, PAREDE, bfs
+
+# ----------------------------------------------------
+# BFS por camadas com bitsets (inteiros grandes do Python, sem NumPy)
+#   - 1 bit por célula. Cada linha ganha uma coluna extra sempre 0
+#     (largura = cols + 1): assim << 1 / >> 1 caem nessa coluna, que
+#     nunca está livre, e não passam de uma linha para a outra sem
+#     precisar de máscaras de borda
+#   - Uma camada inteira é expandida com 4 deslocamentos (<< largura,
+#     >> largura, << 1, >> 1), ORs e um AND com as células ainda não
+#     visitadas; cada operação roda em C, palavra a palavra
+#   - Nada é guardado por camada: os bits da distância (bit k de d) são
+#     montados com "fotos" das não visitadas no início e no fim de cada
+#     sequência de camadas com o bit k ligado
+#   - pred sai no fim só dos bits 0 e 1 da distância: num grid vizinhos
+#     alcançados têm distâncias que diferem de exatamente 1 (paridade de
+#     r + c), então d mod 4 já diz qual dos dois é o predecessor
+#   - dist/pred viram array('i') sem laço por célula: cada máscara vira
+#     1 byte por célula (bytes.translate), os bytes são combinados com OR
+#     (como inteiros) e intercalados nos 4 bytes de cada int32 por
+#     atribuição de fatias com passo (veja GridBits.para_array)
+# Cada camada custa O(células / 30) operações de palavra sobre o grid
+# inteiro, então o total cresce com camadas x células. O bfs com fila custa
+# O(células), e a montagem de dist/pred aqui custa mais ou menos a metade
+# disso: o bitset só ganha quando a busca tem poucas camadas. Medido
+# (campo aberto, 20% de paredes), o ponto de empate fica perto de 600
+# camadas, com qualquer tamanho de grid:
+#   300x300 a partir do centro (~300 camadas): 0.043s contra 0.075s do bfs
+#   1500x1500 a partir do canto (~3000 camadas): 2.5s contra 1.6s
+#   labirinto de corredores 201x201 (milhares de camadas): 0.073s contra 0.015s
+# Por isso bfs_bitset usa o bfs comum quando a busca passaria de
+# LIMITE_CAMADAS camadas: direto, se a distância (Manhattan) até o canto
+# mais longe do grid (ou até o goal, com parar_no_goal) já passa do
+# limite; senão desiste no meio, quando as camadas passam do limite.
+# ----------------------------------------------------
+
+LIMITE_CAMADAS = 600
+
+# Estado BRANCO (livre) -> '1', qualquer outro -> '0'
+_TABELA_LIVRES = b'1' + b'0' * 255
+_TABELA_VISITADOS = bytes.maketrans(b'01', bytes([BRANCO, PRETO]))
+# Posição de cada byte (do menos para o mais significativo) dentro do int32
+_POSICOES = (0, 1, 2, 3) if sys.byteorder == 'little' else (3, 2, 1, 0)
+
+class GridBits:
+    """Conversões entre o grid (rows x cols) e máscaras com a coluna extra."""
+    def __init__(self, rows, cols):
+        self.rows, self.cols = rows, cols
+        self.largura = cols + 1
+        self.n = rows * cols
+
+    def bit(self, cell):
+        return 1 << (cell[0] * self.largura + cell[1])
+
+    def mascara(self, texto):
+        """Máscara a partir de bytes '0'/'1' (caractere r * cols + c = célula (r, c))."""
+        cols = self.cols
+        linhas = [texto[i:i + cols] for i in range(0, self.n, cols)]
+        return int((b'0'.join(linhas) + b'0')[::-1], 2) if linhas else 0
+
+    def bits(self, mascara):
+        """Inverso de mascara: bytes '0'/'1' com n caracteres, sem a coluna extra."""
+        largura, cols = self.largura, self.cols
+        texto = format(mascara, '0%db' % (self.rows * largura))[::-1].encode()
+        return b''.join(texto[i:i + cols] for i in range(0, len(texto), largura))
+
+    def bytes_de(self, mascara, valor):
+        """n bytes: `valor` onde o bit está ligado, 0 no resto."""
+        return self.bits(mascara).translate(bytes.maketrans(b'01', bytes([0, valor])))
+
+    def para_array(self, *planos):
+        """array('i') cujo byte j (do menos significativo) de cada célula vem de planos[j]."""
+        buf = bytearray(4 * self.n)
+        for j, plano in enumerate(planos):
+            buf[_POSICOES[j]::4] = plano
+        a = array('i')
+        a.frombytes(buf)
+        return a
+
+def _ou(*planos):
+    """OR byte a byte de planos (bytes) do mesmo tamanho."""
+    valor = 0
+    for plano in planos:
+        valor |= int.from_bytes(plano, 'little')
+    return valor.to_bytes(len(planos[0]), 'little')
+
+# ----------------------------------------------------
+# Camadas do BFS a partir de start só com operações de bitset.
+# Devolve (grid, visitados, bits_dist): bits_dist[k] = células cuja
+# distância tem o bit k ligado. Com goal, para na camada que o alcança.
+# Com max_camadas, devolve None se a busca passar dessa quantidade.
+# ----------------------------------------------------
+def camadas_bitset(maze, start, goal=None, estado=None, max_camadas=None):
+    if estado is None:
+        estado = GridState.from_maze(maze)
+    grid = GridBits(estado.rows, estado.cols)
+    largura = grid.largura
+    livres = grid.mascara(bytes(estado.state).translate(_TABELA_LIVRES))
+
+    bit_goal = grid.bit(goal) if goal is not None else 0
+    fronteira = grid.bit(start) & livres
+    nao_visitados = livres ^ fronteira
+    bits_dist = []
+    fotos = []     # fotos[k]: nao_visitados antes da sequência atual com o bit k ligado
+    d = 0
+    while fronteira:
+        if fronteira & bit_goal:
+            proxima = 0
+        else:
+            proxima = ((fronteira << largura) | (fronteira >> largura)
+                       | (fronteira << 1) | (fronteira >> 1)) & nao_visitados
+        # Fecha as sequências do bit k que terminam na camada d: o bit k
+        # de d + 1 desliga (ou a busca acabou)
+        for k in range(len(fotos)):
+            if d >> k & 1 and (not proxima or not (d + 1) >> k & 1):
+                bits_dist[k] |= fotos[k] ^ nao_visitados
+        if not proxima:
+            break
+        d += 1
+        if max_camadas is not None and d > max_camadas:
+            return None
+        # Abre as sequências do bit k que começam na camada d
+        # (d termina em 1 seguido de k zeros)
+        k = (d & -d).bit_length() - 1
+        if k == len(fotos):
+            fotos.append(0)
+            bits_dist.append(0)
+        fotos[k] = nao_visitados
+        nao_visitados ^= proxima
+        fronteira = proxima
+    return grid, livres ^ nao_visitados, bits_dist
+
+# ----------------------------------------------------
+# Motor completo: mesmo (estado, path) do bfs do solver
+#   - pred escolhe, nesta ordem, o vizinho de cima, de baixo, da esquerda
+#     ou da direita que está a uma camada a menos (o desempate pode
+#     diferir do bfs com fila, mas as distâncias são as mesmas)
+#   - parar_no_goal=True encerra na camada em que o goal é descoberto
+#   - Mais de limite_camadas camadas: usa o bfs do solver (veja acima)
+# ----------------------------------------------------
+def bfs_bitset(maze, start, goal, parar_no_goal=False, limite_camadas=LIMITE_CAMADAS):
+    estado = GridState.from_maze(maze)
+    state, cols = estado.state, estado.cols
+    if state[start[0] * cols + start[1]] == PAREDE or state[goal[0] * cols + goal[1]] == PAREDE:
+        return estado, []
+    if parar_no_goal:
+        longe = abs(start[0] - goal[0]) + abs(start[1] - goal[1])
+    else:
+        longe = (max(start[0], estado.rows - 1 - start[0])
+                 + max(start[1], estado.cols - 1 - start[1]))
+    if longe > limite_camadas:
+        return bfs(maze, start, goal, parar_no_goal=parar_no_goal)
+    camadas = camadas_bitset(maze, start, goal if parar_no_goal else None, estado,
+                             limite_camadas)
+    if camadas is None:
+        return bfs(maze, start, goal, parar_no_goal=parar_no_goal)
+    grid, visitados, bits_dist = camadas
+    largura = grid.largura
+
+    # dist: o byte j de cada célula junta os bits 8j..8j+7 da distância;
+    # fora do alcance, todos os bytes em 0xff (-1)
+    nao_alcancados = grid.bytes_de(grid.mascara(b'1' * grid.n) ^ visitados, 0xff)
+    estado.dist = grid.para_array(*[
+        _ou(nao_alcancados, *[grid.bytes_de(m, 1 << (k - j)) for k, m in
+                              enumerate(bits_dist[j:j + 8], j)])
+        for j in range(0, 32, 8)])
+
+    # v e o vizinho u = v + delta, ambos alcançados: u é predecessor de v
+    # quando d(u) = d(v) - 1, ou seja (em d mod 4) bit1(u) ^ bit1(v) ^ bit0(v) = 1
+    bit0, bit1 = (bits_dist + [0, 0])[:2]
+    teste = bit1 ^ bit0
+    sem_pred = grid.bytes_de(grid.mascara(b'1' * grid.n) ^ visitados ^ grid.bit(start), 0xff)
+    pred = int.from_bytes(grid.para_array(sem_pred, sem_pred, sem_pred, sem_pred), 'little')
+    resto = visitados ^ grid.bit(start)
+    for deslocamento, delta in ((largura, -cols), (-largura, cols), (1, -1), (-1, 1)):
+        # deslocamento > 0: o vizinho (índice menor) sobe para a posição de v
+        if deslocamento > 0:
+            vizinho_ok = (visitados << deslocamento) & ((bit1 << deslocamento) ^ teste)
+        else:
+            vizinho_ok = (visitados >> -deslocamento) & ((bit1 >> -deslocamento) ^ teste)
+        escolhidos = resto & vizinho_ok
+        if escolhidos:
+            resto ^= escolhidos
+            indices = array('i', range(delta, grid.n + delta))
+            selecao = grid.bytes_de(escolhidos, 0xff)
+            pred |= (int.from_bytes(indices, 'little')
+                     & int.from_bytes(grid.para_array(selecao, selecao, selecao, selecao), 'little'))
+    estado.pred = array('i')
+    estado.pred.frombytes(pred.to_bytes(4 * grid.n, 'little'))
+
+    # state: visitados -> PRETO; o estado inicial só tem BRANCO (0) e PAREDE,
+    # e nenhuma parede é visitada, então um OR byte a byte junta os dois
+    pretos = grid.bits(visitados).translate(_TABELA_VISITADOS)
+    state = int.from_bytes(pretos, 'little') | int.from_bytes(estado.state, 'little')
+    estado.state = bytearray(state.to_bytes(grid.n, 'little'))
+
+    path = estado.path_to(goal)
+    return estado, path
+
+# Disponível em solver.resolver(..., motor='bfs_bitset') depois que este módulo é importado
+MOTORES['bfs_bitset'] = bfs_bitset
@@ -0,0 +1,79 @@
+from array import array
+
+import numpy as np
+
+from solver import GridState, MOTORES, BRANCO, PRETO, PAREDE
+
+# ----------------------------------------------------
+# BFS vetorizado (por camadas) com NumPy
+#   - maze é tratado como um array booleano de paredes
+#   - Cada camada da fronteira é expandida de uma só vez: os índices da
+#     fronteira são deslocados (-cols, +cols, -1, +1) e filtrados por
+#     máscaras de borda, sem o laço get_neighbors + deque por célula
+#   - Produz as mesmas camadas de dist que draw_tree_with_positions agrupa
+#   - parar_no_goal=True encerra na camada em que o goal é descoberto
+# ----------------------------------------------------
+def bfs_numpy(maze, start, goal, parar_no_goal=False):
+    paredes = np.asarray(maze, dtype=bool)
+    rows, cols = paredes.shape
+    n = rows * cols
+    ultima_linha = (rows - 1) * cols
+
+    # Paredes contam como "visitadas" para nunca entrarem na fronteira
+    visitado = paredes.ravel().copy()
+    dist = np.full(n, -1, dtype=np.int32)
+    pred = np.full(n, -1, dtype=np.int32)
+
+    s = start[0] * cols + start[1]
+    g = goal[0] * cols + goal[1]
+    if paredes.flat[s] or paredes.flat[g]:   # nada explorado, como nos outros motores
+        return GridState.from_maze(maze), []
+    visitado[s] = True
+    dist[s] = 0
+    fronteira = np.array([s], dtype=np.intp)
+    d = 0
+
+    while fronteira.size:
+        d += 1
+        c = fronteira % cols
+        # Pais válidos para cada direção (cima, baixo, esquerda, direita)
+        pais = (fronteira[fronteira >= cols],
+                fronteira[fronteira < ultima_linha],
+                fronteira[c > 0],
+                fronteira[c < cols - 1])
+        pais_todos = np.concatenate(pais)
+        cand = np.concatenate((pais[0] - cols, pais[1] + cols, pais[2] - 1, pais[3] + 1))
+
+        livres = ~visitado[cand]
+        cand, pais_todos = cand[livres], pais_todos[livres]
+
+        # Um mesmo nó pode aparecer várias vezes (vindo de pais diferentes):
+        # a última escrita em pred vence e serve para eliminar as repetições
+        pred[cand] = pais_todos
+        novos = cand[pred[cand] == pais_todos]
+
+        visitado[novos] = True
+        dist[novos] = d
+        fronteira = novos
+        if parar_no_goal and visitado[g]:
+            break
+
+    # Monta o mesmo GridState do solver, para o resto do código não mudar
+    state = np.where(dist >= 0, PRETO, BRANCO).astype(np.uint8)
+    state[paredes.ravel()] = PAREDE
+    estado = GridState(rows, cols, bytearray(state.tobytes()),
+                       dist=_para_array(dist), pred=_para_array(pred))
+
+    path = estado.path_to(goal)
+    return estado, path
+
+# ----------------------------------------------------
+# Converte um vetor int32 do NumPy em array('i') sem passar por listas
+# ----------------------------------------------------
+def _para_array(valores):
+    a = array('i')
+    a.frombytes(valores.tobytes())
+    return a
+
+# Disponível em solver.resolver(..., motor='bfs_numpy') depois que este módulo é importado
+MOTORES['bfs_numpy'] = bfs_numpy
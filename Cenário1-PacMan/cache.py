@@ -0,0 +1,126 @@
+import hashlib
+from collections import OrderedDict
+
+from solver import bfs
+
+# ----------------------------------------------------
+# Cache de campos de distância por alvo
+#   - Um BFS "reverso" a partir do alvo dá, para toda célula,
+#     a distância até o alvo (dist) e o próximo passo rumo a ele (pred)
+#   - Como o grafo é não orientado, o BFS comum a partir do alvo basta
+#   - Chave: hash do conteúdo do labirinto + índice do alvo
+#   - Remoção LRU por número de entradas e por memória ocupada
+# Depois disso, qualquer consulta (start -> alvo em cache) custa
+# O(tamanho do caminho), sem nova busca.
+#
+# O hash percorre o grid inteiro, então o cache o guarda junto com o
+# objeto do labirinto e uma versão: só é recalculado quando chega outro
+# labirinto ou outra versão. Quem muda células do labirinto incrementa a
+# versão que passa nas consultas:
+#   cache.caminho(maze, start, alvo)
+#   maze[r][c] = 1; versao += 1
+#   cache.caminho(maze, start, alvo, versao)
+# ----------------------------------------------------
+
+# ----------------------------------------------------
+# Hash do conteúdo do labirinto (muda se qualquer célula mudar)
+# ----------------------------------------------------
+def hash_labirinto(maze):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(b'%d,%d;' % (len(maze), len(maze[0])))
+    cells = getattr(maze, 'cells', None)
+    if cells is not None:       # maze_io.Labirinto: buffer plano, um update só
+        h.update(cells)
+    else:
+        for linha in maze:
+            h.update(bytes(linha))
+    return h.hexdigest()
+
+class CacheCamposDistancia:
+    def __init__(self, max_entradas=64, max_bytes=256 * 1024 * 1024):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._entradas = OrderedDict()  # (hash, alvo) -> (estado, bytes)
+        self._bytes = 0
+        self._hash = (None, None, None)   # (maze, versão, hash) da última consulta
+        self.acertos = 0
+        self.falhas = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    @property
+    def bytes_usados(self):
+        return self._bytes
+
+    # ------------------------------------------------
+    # Hash de maze, recalculado só quando o objeto ou a versão mudam
+    # (a referência ao maze fica guardada: o mesmo objeto, não só o id)
+    # ------------------------------------------------
+    def _hash_de(self, maze, versao):
+        anterior, versao_anterior, hash_maze = self._hash
+        if anterior is not maze or versao_anterior != versao:
+            hash_maze = hash_labirinto(maze)
+            self._hash = (maze, versao, hash_maze)
+        return hash_maze
+
+    # ------------------------------------------------
+    # Devolve o GridState do BFS a partir de target, calculando se preciso.
+    # versao: incrementada por quem muda células do maze entre consultas.
+    # ------------------------------------------------
+    def campo(self, maze, target, versao=0):
+        chave = (self._hash_de(maze, versao), target[0] * len(maze[0]) + target[1])
+
+        item = self._entradas.get(chave)
+        if item is not None:
+            self._entradas.move_to_end(chave)  # usado mais recentemente
+            self.acertos += 1
+            return item[0]
+
+        self.falhas += 1
+        estado, _ = bfs(maze, target, target)
+        tamanho = (len(estado.state)
+                   + len(estado.dist) * estado.dist.itemsize
+                   + len(estado.pred) * estado.pred.itemsize)
+        self._entradas[chave] = (estado, tamanho)
+        self._bytes += tamanho
+        self._remover_excesso()
+        return estado
+
+    def _remover_excesso(self):
+        # Sempre mantém ao menos a entrada recém-inserida
+        while len(self._entradas) > 1 and (len(self._entradas) > self.max_entradas
+                                           or self._bytes > self.max_bytes):
+            _, (_, tamanho) = self._entradas.popitem(last=False)
+            self._bytes -= tamanho
+
+    def limpar(self):
+        self._entradas.clear()
+        self._bytes = 0
+        self._hash = (None, None, None)
+
+    # ------------------------------------------------
+    # Consultas (start -> target) sobre o campo em cache
+    # ------------------------------------------------
+    def distancia(self, maze, start, target, versao=0):
+        estado = self.campo(maze, target, versao)
+        d = estado.dist[estado.node_index(*start)]
+        return d if d >= 0 else None
+
+    def proximo_passo(self, maze, start, target, versao=0):
+        estado = self.campo(maze, target, versao)
+        p = estado.pred[estado.node_index(*start)]
+        return estado.coords(p) if p >= 0 else None
+
+    def caminho(self, maze, start, target, versao=0):
+        estado = self.campo(maze, target, versao)
+        u = estado.node_index(*start)
+        if estado.dist[u] < 0:
+            return []
+        # Segue o próximo passo (pred do BFS reverso) até o alvo
+        pred, cols = estado.pred, estado.cols
+        path = []
+        while u >= 0:
+            path.append(divmod(u, cols))
+            u = pred[u]
+        return path
@@ -0,0 +1,152 @@
+import math
+
+import numpy as np
+import pygame
+
+# ----------------------------------------------------
+# Câmera (zoom + deslocamento) sobre um grid rows x cols
+#   - zoom: pixels por célula (pode ser < 1 em labirintos enormes)
+#   - x0, y0: coluna/linha (fracionárias) no canto superior esquerdo
+# ----------------------------------------------------
+ZOOM_MAXIMO = 64.0
+
+class Camera:
+    def __init__(self, rows, cols, largura, altura):
+        self.rows, self.cols = rows, cols
+        self.largura, self.altura = largura, altura
+        self.enquadrar()
+
+    def enquadrar(self):
+        """Mostra o labirinto inteiro."""
+        self.zoom = min(self.largura / self.cols, self.altura / self.rows)
+        self.zoom_minimo = self.zoom / 2
+        self.x0 = self.y0 = 0.0
+
+    def _limitar(self):
+        # Deixa sempre pelo menos metade da tela sobre o labirinto
+        meia_l = self.largura / self.zoom / 2
+        meia_a = self.altura / self.zoom / 2
+        self.x0 = min(max(self.x0, -meia_l), self.cols - meia_l)
+        self.y0 = min(max(self.y0, -meia_a), self.rows - meia_a)
+
+    def mover(self, dx_px, dy_px):
+        self.x0 += dx_px / self.zoom
+        self.y0 += dy_px / self.zoom
+        self._limitar()
+
+    def aproximar(self, fator, centro=None):
+        """Multiplica o zoom mantendo fixa a célula sob `centro` (pixels)."""
+        cx, cy = centro if centro is not None else (self.largura / 2, self.altura / 2)
+        cel_x = self.x0 + cx / self.zoom
+        cel_y = self.y0 + cy / self.zoom
+        self.zoom = min(max(self.zoom * fator, self.zoom_minimo), ZOOM_MAXIMO)
+        self.x0 = cel_x - cx / self.zoom
+        self.y0 = cel_y - cy / self.zoom
+        self._limitar()
+
+    def janela(self):
+        """Faixa de células visível: (r0, r1, c0, c1), r1/c1 exclusivos."""
+        r0 = max(0, math.floor(self.y0))
+        c0 = max(0, math.floor(self.x0))
+        r1 = min(self.rows, math.ceil(self.y0 + self.altura / self.zoom))
+        c1 = min(self.cols, math.ceil(self.x0 + self.largura / self.zoom))
+        return r0, r1, c0, c1
+
+    def para_tela(self, r, c):
+        return (c - self.x0) * self.zoom, (r - self.y0) * self.zoom
+
+    def para_celula(self, px, py):
+        return int(self.y0 + py / self.zoom), int(self.x0 + px / self.zoom)
+
+# ----------------------------------------------------
+# Visão do grid com culling pela câmera
+#   - Só as células dentro da janela visível são lidas do array de estados
+#   - Quando há mais células que pixels (zoom < 1), a janela é amostrada
+#     de `passo` em `passo` células: visão geral reduzida
+#   - A imagem é montada com pygame.surfarray a partir do array de
+#     estados (paleta estado -> cor) e ampliada com um único scale + blit
+#   - Com zoom grande o bastante, escreve o índice do nó em cada célula
+#     (textos renderizados uma vez e guardados, como no GridRenderer)
+# ----------------------------------------------------
+
+MAX_ROTULOS = 4096   # textos guardados; ao passar disso o cache recomeça
+
+class VisaoGrid:
+    def __init__(self, screen, area, rows, cols, paleta, destaques=None,
+                 cor_fundo=(0, 0, 0), cor_texto=(0, 0, 0), tamanho_fonte=17):
+        self.screen = screen
+        self.area = pygame.Rect(area)
+        self.rows, self.cols = rows, cols
+        self.camera = Camera(rows, cols, self.area.w, self.area.h)
+        self.paleta = np.zeros((256, 3), dtype=np.uint8)
+        for codigo, cor in paleta.items():
+            self.paleta[codigo] = cor
+        self.destaques = dict(destaques or {})
+        self.cor_fundo = cor_fundo
+        self.cor_texto = cor_texto
+        self._font = pygame.font.SysFont(None, tamanho_fonte)
+        self._rotulos = {}        # índice do nó -> superfície com o texto
+        self._caminho = None
+        self._cor_caminho = None
+
+    def definir_caminho(self, path, cor):
+        if path:
+            self._caminho = (np.array([p[0] for p in path]), np.array([p[1] for p in path]))
+        else:
+            self._caminho = None
+        self._cor_caminho = cor
+
+    def _pintar(self, rgb, rr, cc, r0, c0, passo, cor):
+        # Pinta as células (rr, cc) que caem dentro da janela amostrada
+        i = (rr - r0) // passo
+        j = (cc - c0) // passo
+        ok = (rr >= r0) & (cc >= c0) & (i < rgb.shape[0]) & (j < rgb.shape[1])
+        rgb[i[ok], j[ok]] = cor
+
+    def desenhar(self, state):
+        """Desenha a partir do array de estados (bytearray/array plano rows*cols)."""
+        camera = self.camera
+        estados = np.frombuffer(state, dtype=np.uint8).reshape(self.rows, self.cols)
+        self.screen.fill(self.cor_fundo, self.area)
+
+        r0, r1, c0, c1 = camera.janela()
+        if r0 >= r1 or c0 >= c1:
+            return self.area
+
+        passo = max(1, math.ceil(1 / camera.zoom))
+        rgb = self.paleta[estados[r0:r1:passo, c0:c1:passo]]
+
+        if self._caminho is not None:
+            self._pintar(rgb, self._caminho[0], self._caminho[1], r0, c0, passo, self._cor_caminho)
+        for (r, c), cor in self.destaques.items():
+            self._pintar(rgb, np.array([r]), np.array([c]), r0, c0, passo, cor)
+
+        # surfarray usa (x, y): transpõe linhas/colunas
+        imagem = pygame.surfarray.make_surface(rgb.transpose(1, 0, 2))
+        largura = round(rgb.shape[1] * passo * camera.zoom)
+        altura = round(rgb.shape[0] * passo * camera.zoom)
+        imagem = pygame.transform.scale(imagem, (max(1, largura), max(1, altura)))
+        x, y = camera.para_tela(r0, c0)
+
+        anterior = self.screen.get_clip()
+        self.screen.set_clip(self.area)
+        self.screen.blit(imagem, (self.area.x + round(x), self.area.y + round(y)))
+        if camera.zoom >= 24:
+            self._desenhar_rotulos(r0, r1, c0, c1)
+        self.screen.set_clip(anterior)
+        return self.area
+
+    def _desenhar_rotulos(self, r0, r1, c0, c1):
+        z = self.camera.zoom
+        rotulos = self._rotulos
+        if len(rotulos) > MAX_ROTULOS:   # muitas regiões visitadas ao arrastar
+            rotulos.clear()
+        for r in range(r0, r1):
+            for c in range(c0, c1):
+                x, y = self.camera.para_tela(r, c)
+                idx = r * self.cols + c
+                texto = rotulos.get(idx)
+                if texto is None:
+                    texto = rotulos[idx] = self._font.render(str(idx), True, self.cor_texto)
+                self.screen.blit(texto, texto.get_rect(center=(self.area.x + x + z / 2,
+                                                               self.area.y + y + z / 2)))
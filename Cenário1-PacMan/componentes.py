@@ -0,0 +1,104 @@
+from array import array
+
+# ----------------------------------------------------
+# Índice de componentes conexas das células livres (union-find)
+#   - Montado numa única varredura linha a linha: cada célula livre se
+#     une à vizinha da esquerda e à de cima
+#   - A raiz de cada componente é sempre o menor índice dela, então uma
+#     passada em ordem deixa todo nó apontando direto para a raiz e
+#     alcancavel(a, b) vira uma comparação de dois rótulos
+#   - Abrir uma parede (célula fica livre) só faz as uniões com os
+#     vizinhos. Fechar uma parede pode partir uma componente, o que o
+#     union-find não desfaz: o índice é remontado na próxima consulta
+# ----------------------------------------------------
+class IndiceComponentes:
+    def __init__(self, maze):
+        self.rows, self.cols = len(maze), len(maze[0])
+        cells = getattr(maze, 'cells', None)
+        self.cells = bytearray(cells if cells is not None
+                               else b''.join(bytes(linha) for linha in maze))
+        self.remontagens = 0
+        self._montar()
+
+    def _montar(self):
+        cols, cells = self.cols, self.cells
+        n = self.rows * cols
+        pai = self.pai = array('i', [-1]) * n   # -1: parede
+        for u in range(n):
+            if cells[u]:
+                continue
+            if u % cols and not cells[u - 1]:
+                pai[u] = pai[u - 1]
+            else:
+                pai[u] = u
+            if u >= cols and not cells[u - cols]:
+                self._unir(u, u - cols)
+        # Raiz = menor índice e pai[u] <= u: uma passada achata tudo
+        for u in range(n):
+            p = pai[u]
+            if p >= 0:
+                pai[u] = pai[p]
+        self._valido = True
+        self.remontagens += 1
+
+    def _raiz(self, u):
+        pai = self.pai
+        r = u
+        while pai[r] != r:
+            r = pai[r]
+        while pai[u] != r:   # compressão de caminho
+            pai[u], u = r, pai[u]
+        return r
+
+    def _unir(self, a, b):
+        ra, rb = self._raiz(a), self._raiz(b)
+        if ra != rb:
+            if ra < rb:
+                self.pai[rb] = ra
+            else:
+                self.pai[ra] = rb
+
+    # ------------------------------------------------
+    # Mudanças no labirinto
+    # ------------------------------------------------
+    def atualizar(self, mudancas):
+        """Aplica uma lista de (r, c, valor); 0 -> livre, diferente de 0 -> parede."""
+        rows, cols, cells = self.rows, self.cols, self.cells
+        for r, c, valor in mudancas:
+            u = r * cols + c
+            parede = 1 if valor else 0
+            if cells[u] == parede:
+                continue
+            cells[u] = parede
+            if parede:
+                self._valido = False   # pode ter partido uma componente
+            elif self._valido:
+                self.pai[u] = u
+                for v in (u - cols if r > 0 else -1, u + cols if r < rows - 1 else -1,
+                          u - 1 if c > 0 else -1, u + 1 if c < cols - 1 else -1):
+                    if v >= 0 and not cells[v]:
+                        self._unir(u, v)
+
+    def definir_celula(self, r, c, valor):
+        self.atualizar([(r, c, valor)])
+
+    # ------------------------------------------------
+    # Consultas
+    # ------------------------------------------------
+    def rotulo(self, cell):
+        """Rótulo da componente de cell ((r, c)), ou -1 se for parede."""
+        if not self._valido:
+            self._montar()
+        u = cell[0] * self.cols + cell[1]
+        if self.cells[u]:
+            return -1
+        return self._raiz(u)
+
+    def alcancavel(self, start, goal):
+        r = self.rotulo(start)
+        return r >= 0 and r == self.rotulo(goal)
+
+    def num_componentes(self):
+        if not self._valido:
+            self._montar()
+        return sum(1 for u, p in enumerate(self.pai) if p == u)
@@ -0,0 +1,203 @@
+import heapq
+from array import array
+
+from grafo_csr import GrafoCSR
+
+# ----------------------------------------------------
+# Contração de corredores
+#   - "Nós-chave": células livres com grau diferente de 2 (cruzamentos,
+#     becos sem saída e células isoladas)
+#   - Cada corredor (cadeia de células de grau 2) entre dois nós-chave
+#     vira uma única aresta ponderada (peso = número de passos); as
+#     células do corredor ficam guardadas, em ordem, para expandir o
+#     caminho depois. Becos viram uma aresta até a célula do fundo.
+#   - Ciclos sem nenhum nó-chave ganham um nó-chave artificial
+#   - A busca (Dijkstra) roda só sobre os nós-chave; start e goal no meio
+#     de um corredor entram ligados às duas pontas dele
+# No labirinto do main.py sobram 4 nós-chave (3, 4, 13 e 20) das 17 células
+# livres: 15 -> 20 fica no fim do corredor 3 - 2 - 1 - 0 - 5 - 10 - 15 - 20
+# (peso 7) e 22 -> 23 -> 24 dentro do laço que sai e volta ao 13 (peso 8).
+# ----------------------------------------------------
+class GrafoContraido:
+    def __init__(self, rows, cols, cells):
+        self.rows, self.cols = rows, cols
+        self.cells = cells
+        self.adj = {}                      # nó-chave -> [(vizinho, peso, aresta)]
+        self.extremos = array('i')         # aresta e -> pontas em 2e, 2e + 1
+        self.cadeias = array('i')          # células internas de todas as arestas
+        self.offsets = array('i', [0])     # aresta e -> cadeias[offsets[e]:offsets[e + 1]]
+        n = rows * cols
+        self.aresta_da_celula = array('i', [-1]) * n   # célula de corredor -> aresta
+        self.posicao = array('i', [-1]) * n            # ... e posição dentro da cadeia
+
+    # ------------------------------------------------
+    # Monta a contração a partir de qualquer labirinto (ou de um GrafoCSR)
+    # ------------------------------------------------
+    @classmethod
+    def from_maze(cls, maze):
+        csr = maze if getattr(maze, 'offsets', None) is not None else GrafoCSR.from_maze(maze)
+        offsets, vizinhos = csr.offsets, csr.vizinhos
+        grafo = cls(csr.rows, csr.cols, csr.cells)
+        n = csr.rows * csr.cols
+
+        chave = bytearray(n)
+        for u in range(n):
+            if not csr.cells[u] and offsets[u + 1] - offsets[u] != 2:
+                chave[u] = 1
+                grafo.adj[u] = []
+
+        for u in list(grafo.adj):
+            grafo._seguir_corredores(u, chave, offsets, vizinhos)
+
+        # Sobraram só ciclos de corredores: um nó-chave artificial em cada
+        for u in range(n):
+            if not csr.cells[u] and not chave[u] and grafo.aresta_da_celula[u] < 0:
+                chave[u] = 1
+                grafo.adj[u] = []
+                grafo._seguir_corredores(u, chave, offsets, vizinhos)
+        return grafo
+
+    def _seguir_corredores(self, a, chave, offsets, vizinhos):
+        for primeiro in vizinhos[offsets[a]:offsets[a + 1]]:
+            if chave[primeiro]:
+                if a < primeiro:   # dois nós-chave vizinhos: aresta de peso 1
+                    self._nova_aresta(a, primeiro, ())
+                continue
+            if self.aresta_da_celula[primeiro] >= 0:   # já percorrido pela outra ponta
+                continue
+            cadeia = []
+            anterior, atual = a, primeiro
+            while not chave[atual]:
+                cadeia.append(atual)
+                v1, v2 = vizinhos[offsets[atual]:offsets[atual + 1]]
+                anterior, atual = atual, (v2 if v1 == anterior else v1)
+            self._nova_aresta(a, atual, cadeia)
+
+    def _nova_aresta(self, a, b, cadeia):
+        e = len(self.extremos) // 2
+        self.extremos.extend((a, b))
+        for i, u in enumerate(cadeia):
+            self.aresta_da_celula[u] = e
+            self.posicao[u] = i
+        self.cadeias.extend(cadeia)
+        self.offsets.append(len(self.cadeias))
+        peso = len(cadeia) + 1
+        self.adj[a].append((b, peso, e))
+        if b != a:
+            self.adj[b].append((a, peso, e))
+
+    # ------------------------------------------------
+    # Tamanho
+    # ------------------------------------------------
+    @property
+    def num_nos(self):
+        return len(self.adj)
+
+    @property
+    def num_arestas(self):
+        return len(self.extremos) // 2
+
+    @property
+    def fator_reducao(self):
+        """Células livres por nó-chave (quanto o grafo encolheu)."""
+        livres = len(self.cells) - sum(1 for x in self.cells if x)
+        return livres / max(1, self.num_nos)
+
+    def cadeia(self, e, a=None):
+        """Células internas da aresta e, na ordem de quem sai da ponta a."""
+        cadeia = list(self.cadeias[self.offsets[e]:self.offsets[e + 1]])
+        if a is not None and a != self.extremos[2 * e]:
+            cadeia.reverse()
+        return cadeia
+
+    # ------------------------------------------------
+    # Ligações de uma célula qualquer com os nós-chave:
+    # [(nó-chave, custo, células entre a célula e o nó, sem as pontas)]
+    # ------------------------------------------------
+    def _ancoras(self, u):
+        if u in self.adj:
+            return [(u, 0, [])]
+        e = self.aresta_da_celula[u]
+        p = self.posicao[u]
+        cadeia = self.cadeia(e)
+        a, b = self.extremos[2 * e], self.extremos[2 * e + 1]
+        return [(a, p + 1, cadeia[:p][::-1]), (b, len(cadeia) - p, cadeia[p + 1:])]
+
+    # ------------------------------------------------
+    # Menor caminho (lista de (r, c)) de start a goal, ou []
+    # ------------------------------------------------
+    def caminho(self, start, goal):
+        cols = self.cols
+        s = start[0] * cols + start[1]
+        g = goal[0] * cols + goal[1]
+        if self.cells[s] or self.cells[g]:
+            return []
+        if s == g:
+            return [start]
+
+        # Start e goal no mesmo corredor: o trecho direto também concorre
+        melhor, via = float('inf'), None
+        e = self.aresta_da_celula[s]
+        if e >= 0 and e == self.aresta_da_celula[g]:
+            melhor = abs(self.posicao[s] - self.posicao[g])
+
+        ancoras_g = {}
+        for no, custo, trecho in self._ancoras(g):
+            if no not in ancoras_g or custo < ancoras_g[no][0]:
+                ancoras_g[no] = (custo, trecho)
+
+        dist, pred = {}, {}
+        heap = []
+        for no, custo, trecho in self._ancoras(s):
+            if custo < dist.get(no, custo + 1):
+                dist[no] = custo
+                pred[no] = (None, trecho)
+                heapq.heappush(heap, (custo, no))
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d >= melhor:
+                break
+            if d > dist[u]:
+                continue
+            if u in ancoras_g and d + ancoras_g[u][0] < melhor:
+                melhor, via = d + ancoras_g[u][0], u
+            for v, w, e in self.adj[u]:
+                dv = d + w
+                if dv < dist.get(v, dv + 1):
+                    dist[v] = dv
+                    pred[v] = (u, e)
+                    heapq.heappush(heap, (dv, v))
+
+        if melhor == float('inf'):
+            return []
+        if via is None:   # trecho direto dentro do corredor
+            ps, pg = self.posicao[s], self.posicao[g]
+            cadeia = self.cadeia(self.aresta_da_celula[s])
+            trecho = cadeia[ps:pg + 1] if ps <= pg else cadeia[pg:ps + 1][::-1]
+            return [divmod(u, cols) for u in trecho]
+        return self._expandir(s, g, via, pred, ancoras_g[via][1])
+
+    def _expandir(self, s, g, via, pred, trecho_g):
+        # Nós-chave do caminho, de trás para frente a partir de `via`
+        nos = []
+        v = via
+        while True:
+            u, e = pred[v]
+            nos.append((v, e))
+            if u is None:
+                break
+            v = u
+        nos.reverse()
+
+        # start, células até o primeiro nó-chave, corredores entre os nós, goal
+        primeiro, trecho_s = nos[0]
+        celulas = [] if primeiro == s else [s] + trecho_s
+        anterior = None
+        for no, e in nos:
+            if anterior is not None:
+                celulas += self.cadeia(e, anterior)
+            celulas.append(no)
+            anterior = no
+        if via != g:
+            celulas += trecho_g[::-1] + [g]
+        return [divmod(u, self.cols) for u in celulas]
@@ -0,0 +1,185 @@
+import heapq
+from array import array
+
+from solver import GridState, bfs, vizinhos_idx, BRANCO, PRETO, PAREDE
+
+# ----------------------------------------------------
+# Busca dinâmica (estilo LPA*) para labirintos cujas paredes mudam
+#   - Mantém g (distância atual) e rhs (melhor distância vista pelos
+#     vizinhos) de todas as células entre uma chamada e outra
+#   - Quando uma célula vira parede (1) ou fica livre (0), só as células
+#     cujo g deixa de bater com rhs ("inconsistentes") são reprocessadas
+#   - Sem heurística e sem parar no goal: ao final, g é exatamente o
+#     dist de um BFS novo a partir do start, para todas as células
+#   - O próprio start também pode andar (mover_start). Com `alvos`, o
+#     reparo para assim que as distâncias dos alvos estão certas; o
+#     restante fica na fila e é terminado numa próxima chamada ou antes
+#     de qualquer consulta
+# ----------------------------------------------------
+
+INF = 2 ** 31 - 1   # "infinito" que ainda cabe num array('i')
+
+class BFSDinamico:
+    def __init__(self, maze, start):
+        self.rows, self.cols = len(maze), len(maze[0])
+        n = self.rows * self.cols
+        # Cópia própria das células (diferente de 0 -> parede)
+        self.paredes = bytearray(b''.join(bytes(linha) for linha in maze))
+        self.start = start
+        self._s = start[0] * self.cols + start[1]
+        self._heap = []
+        self.processados = 0   # nós reprocessados na última atualização
+
+        # A árvore inicial vem de um BFS comum: já nasce consistente (g == rhs)
+        inicial, _ = bfs(maze, start, start)
+        self.g = array('i', (d if d >= 0 else INF for d in inicial.dist))
+        self.rhs = array('i', self.g)
+        self.pred = inicial.pred
+        if self.paredes[self._s]:   # start em parede: nada é alcançável
+            self.g = array('i', [INF]) * n
+            self.rhs = array('i', self.g)
+            self.pred = array('i', [-1]) * n
+
+    # ------------------------------------------------
+    # Recalcula rhs (e o predecessor) de u a partir dos vizinhos
+    # ------------------------------------------------
+    def _atualizar_vertice(self, u):
+        g, rhs, pred, paredes = self.g, self.rhs, self.pred, self.paredes
+        if paredes[u]:
+            rhs[u], pred[u] = INF, -1
+        elif u == self._s:
+            rhs[u], pred[u] = 0, -1
+        else:
+            melhor, p = INF, -1
+            for v in vizinhos_idx(u, self.rows, self.cols):
+                gv = g[v]
+                if not paredes[v] and gv != INF and gv + 1 < melhor:
+                    melhor, p = gv + 1, v
+            rhs[u], pred[u] = melhor, p
+        if g[u] != rhs[u]:
+            heapq.heappush(self._heap, (min(g[u], rhs[u]), u))
+
+    # ------------------------------------------------
+    # Limite da fila a partir do qual os alvos já estão resolvidos:
+    # a maior chave dos alvos (+1 para os ainda inconsistentes);
+    # sem nenhum alvo, -1: a fila para antes do primeiro nó
+    # ------------------------------------------------
+    def _limite_alvos(self, alvos):
+        g, rhs = self.g, self.rhs
+        limite = -1
+        for t in alvos:
+            k = min(g[t], rhs[t]) + (g[t] != rhs[t])
+            if k > limite:
+                limite = k
+        return limite
+
+    # ------------------------------------------------
+    # Processa os nós inconsistentes até a árvore ficar estável
+    # (ou, com alvos, só até as distâncias deles ficarem certas)
+    # ------------------------------------------------
+    def _propagar(self, alvos=None):
+        g, rhs, heap = self.g, self.rhs, self._heap
+        rows, cols = self.rows, self.cols
+        processados = 0
+        limite = -1 if alvos is not None else INF + 1
+        while heap:
+            if heap[0][0] >= limite:
+                limite = self._limite_alvos(alvos)
+                if heap[0][0] >= limite:
+                    break
+            k, u = heapq.heappop(heap)
+            gu, ru = g[u], rhs[u]
+            if gu == ru or k != min(gu, ru):   # entrada antiga na fila
+                continue
+            processados += 1
+            if gu > ru:     # distância diminuiu: fixa e avisa os vizinhos
+                g[u] = ru
+            else:           # distância aumentou: invalida e recalcula
+                g[u] = INF
+                self._atualizar_vertice(u)
+            for v in vizinhos_idx(u, rows, cols):
+                self._atualizar_vertice(v)
+        self.processados = processados
+
+    def _completar(self):
+        # Termina um reparo deixado pela metade (antes de consultas)
+        if self._heap:
+            processados = self.processados
+            self._propagar()
+            self.processados += processados
+
+    # ------------------------------------------------
+    # Mudanças no labirinto
+    # ------------------------------------------------
+    def atualizar(self, mudancas, alvos=None):
+        """Aplica uma lista de (r, c, valor) de uma vez e repara a árvore."""
+        cols = self.cols
+        for r, c, valor in mudancas:
+            u = r * cols + c
+            parede = 1 if valor else 0
+            if self.paredes[u] == parede:
+                continue
+            self.paredes[u] = parede
+            self._atualizar_vertice(u)
+            for v in vizinhos_idx(u, self.rows, cols):
+                self._atualizar_vertice(v)
+        self._propagar(alvos)
+
+    def definir_celula(self, r, c, valor):
+        self.atualizar([(r, c, valor)])
+
+    def alternar(self, r, c):
+        self.definir_celula(r, c, 0 if self.paredes[r * self.cols + c] else 1)
+
+    def mover_start(self, start, alvos=None):
+        """
+        Troca a origem da árvore (ex.: o Pac-Man andou uma célula).
+        alvos: índices de nó cujas distâncias precisam ficar certas agora;
+        sem alvos, a árvore inteira é reparada.
+        """
+        antigo = self._s
+        self.start = start
+        self._s = start[0] * self.cols + start[1]
+        self._atualizar_vertice(antigo)
+        self._atualizar_vertice(self._s)
+        self._propagar(alvos)
+
+    # ------------------------------------------------
+    # Próximo passo de u em direção ao start (-1 se não houver)
+    # Depois de um reparo com alvos, só vale para os alvos.
+    # ------------------------------------------------
+    def proximo_idx(self, u):
+        return self.pred[u] if self.g[u] != INF else -1
+
+    # ------------------------------------------------
+    # Consultas
+    # ------------------------------------------------
+    def distancia(self, goal):
+        self._completar()
+        d = self.g[goal[0] * self.cols + goal[1]]
+        return d if d != INF else None
+
+    def path_to(self, goal):
+        self._completar()
+        cols = self.cols
+        u = goal[0] * cols + goal[1]
+        if self.g[u] == INF:
+            return []
+        path = []
+        while u >= 0:
+            path.append(divmod(u, cols))
+            u = self.pred[u]
+        path.reverse()
+        return path
+
+    def estado(self):
+        """GridState equivalente ao de um bfs novo (para visualizar/comparar)."""
+        self._completar()
+        rows, cols = self.rows, self.cols
+        state = bytearray(PAREDE if p else BRANCO for p in self.paredes)
+        dist = array('i', [-1]) * (rows * cols)
+        for i, d in enumerate(self.g):
+            if d != INF:
+                dist[i] = d
+                state[i] = PRETO
+        return GridState(rows, cols, state, dist=dist, pred=array('i', self.pred))
@@ -0,0 +1,260 @@
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import maze_io
+from cache import hash_labirinto
+
+# ----------------------------------------------------
+# Tabela de distâncias entre todos os pares de células livres, em disco
+#   - Calculada uma vez (um BFS por origem, em paralelo num pool de
+#     processos) e aberta depois com mmap: distancia(a, b) é uma leitura
+#     na tabela, sem busca nenhuma
+#   - As m células livres ganham índices compactos 0..m-1 (paredes ficam
+#     de fora); como d(a, b) = d(b, a), só o triângulo acima da diagonal
+#     é guardado: m * (m - 1) / 2 valores uint16
+#   - O hash do labirinto (cache.hash_labirinto) vai no cabeçalho: uma
+#     tabela de outro labirinto é recusada ao abrir
+#   - Distância 1 <-> células vizinhas: a tabela também responde o que a
+#     matriz do criarMatrizAdjacencia responde (adjacente, matriz_adjacencia)
+#
+# Formato: cabeçalho | índice compacto de cada célula (int32, -1 parede)
+#          | triângulo superior (uint16, linha após linha)
+# Valores na ordem de bytes nativa (little-endian nas máquinas alvo).
+#
+#   python distancias.py labirinto.txt|bin tabela.dist [processos]
+# ----------------------------------------------------
+
+MAGICO = b'DST1'
+# mágico, rows, cols, m (células livres), hash do labirinto (hex)
+CABECALHO = struct.Struct('<4sIII32s')
+INALCANCAVEL = 0xFFFF
+
+def _tamanhos(n, m):
+    inicio_tabela = CABECALHO.size + 4 * n
+    return inicio_tabela, inicio_tabela + 2 * (m * (m - 1) // 2)
+
+def _inicio_linha(i, m):
+    """Posição (em valores) do par (i, i + 1) no triângulo superior."""
+    return i * (2 * m - i - 1) // 2
+
+# ----------------------------------------------------
+# Grafo compacto: só as células livres, vizinhos em CSR com índices 0..m-1
+# ----------------------------------------------------
+def _grafo_compacto(maze):
+    cells = getattr(maze, 'cells', None)
+    if cells is not None:
+        rows, cols = maze.rows, maze.cols
+        cells = bytes(cells)
+    else:
+        rows, cols = len(maze), len(maze[0])
+        cells = b''.join(bytes(linha) for linha in maze)
+    n = rows * cols
+    indice = array('i', [-1]) * n
+    livres = array('i')
+    for u in range(n):
+        if not cells[u]:
+            indice[u] = len(livres)
+            livres.append(u)
+
+    offsets = array('i', [0])
+    vizinhos = array('i')
+    for u in livres:
+        c = u % cols
+        for v in (u - cols if u >= cols else -1,
+                  u + cols if u < n - cols else -1,
+                  u - 1 if c > 0 else -1,
+                  u + 1 if c < cols - 1 else -1):
+            if v >= 0 and not cells[v]:
+                vizinhos.append(indice[v])
+        offsets.append(len(vizinhos))
+    return rows, cols, indice, offsets, vizinhos
+
+# ----------------------------------------------------
+# Lado dos processos do pool: cada um escreve as suas linhas direto no
+# arquivo (mmap), sem devolver as distâncias pelo pipe
+# ----------------------------------------------------
+_adjacentes = None
+_mapa = None
+
+def _iniciar_processo(caminho, offsets, vizinhos):
+    global _adjacentes, _mapa
+    # Tuplas prontas: iterar sobre elas é mais rápido que fatiar o CSR a cada nó
+    _adjacentes = [tuple(vizinhos[offsets[u]:offsets[u + 1]]) for u in range(len(offsets) - 1)]
+    with open(caminho, 'r+b') as f:
+        _mapa = mmap.mmap(f.fileno(), 0)
+
+def _distancias_de(origem, adjacentes):
+    """BFS por camadas a partir de origem: array('H') com m distâncias."""
+    dist = array('H', [INALCANCAVEL]) * len(adjacentes)
+    dist[origem] = 0
+    fronteira = [origem]
+    d = 0
+    while fronteira:
+        d += 1
+        if d >= INALCANCAVEL:
+            raise ValueError("Distância maior que %d não cabe em uint16" % (INALCANCAVEL - 1))
+        proxima = []
+        append = proxima.append
+        for u in fronteira:
+            for v in adjacentes[u]:
+                if dist[v] == INALCANCAVEL:
+                    dist[v] = d
+                    append(v)
+        fronteira = proxima
+    return dist
+
+def _calcular_linhas(origens, inicio_tabela):
+    m = len(_adjacentes)
+    for i in origens:
+        linha = _distancias_de(i, _adjacentes)[i + 1:]
+        inicio = inicio_tabela + 2 * _inicio_linha(i, m)
+        _mapa[inicio:inicio + 2 * len(linha)] = linha.tobytes()
+    _mapa.flush()
+    return len(origens)
+
+# ----------------------------------------------------
+# Calcula a tabela de maze e grava em caminho
+# ----------------------------------------------------
+def calcular_tabela(maze, caminho, processos=None, tamanho_bloco=64, on_progress=None):
+    rows, cols, indice, offsets, vizinhos = _grafo_compacto(maze)
+    n, m = rows * cols, len(offsets) - 1
+    inicio_tabela, fim = _tamanhos(n, m)
+
+    temporario = caminho + '.tmp'   # só vira a tabela de verdade quando estiver completo
+    with open(temporario, 'wb') as f:
+        f.write(CABECALHO.pack(MAGICO, rows, cols, m, hash_labirinto(maze).encode()))
+        f.write(indice.tobytes())
+        f.truncate(fim)
+
+    feitas = 0
+    try:
+        with ProcessPoolExecutor(processos, initializer=_iniciar_processo,
+                                 initargs=(temporario, offsets, vizinhos)) as executor:
+            futuros = [executor.submit(_calcular_linhas, range(i, min(i + tamanho_bloco, m)),
+                                       inicio_tabela)
+                       for i in range(0, m, tamanho_bloco)]
+            for futuro in as_completed(futuros):
+                feitas += futuro.result()
+                if on_progress is not None:
+                    on_progress(feitas, m)
+    except BaseException:
+        os.remove(temporario)
+        raise
+    os.replace(temporario, caminho)
+
+# ----------------------------------------------------
+# Tabela aberta com mmap (só leitura)
+# ----------------------------------------------------
+class TabelaDistancias:
+    def __init__(self, caminho, maze=None):
+        self._arquivo = open(caminho, 'rb')
+        try:
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:   # arquivo vazio
+            self._arquivo.close()
+            raise ValueError("Tabela de distâncias vazia: %s" % caminho)
+        if len(self._mapa) < CABECALHO.size:
+            self.close()
+            raise ValueError("Tabela de distâncias inválida: %s" % caminho)
+        magico, self.rows, self.cols, self.m, hash_maze = CABECALHO.unpack_from(self._mapa, 0)
+        n = self.rows * self.cols
+        inicio_tabela, fim = _tamanhos(n, self.m)
+        if magico != MAGICO or len(self._mapa) < fim:
+            self.close()
+            raise ValueError("Tabela de distâncias inválida: %s" % caminho)
+        self.hash_maze = hash_maze.decode()
+        if maze is not None and hash_labirinto(maze) != self.hash_maze:
+            self.close()
+            raise ValueError("Tabela de distâncias de outro labirinto: %s" % caminho)
+        mv = memoryview(self._mapa)
+        self.indice = mv[CABECALHO.size:inicio_tabela].cast('i')
+        self.tabela = mv[inicio_tabela:fim].cast('H')
+
+    def close(self):
+        if self._mapa is not None:
+            if getattr(self, 'tabela', None) is not None:
+                self.indice.release()
+                self.tabela.release()
+                self.indice = self.tabela = None
+            self._mapa.close()
+            self._arquivo.close()
+            self._mapa = self._arquivo = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------
+    # Consultas (células como (r, c))
+    # ------------------------------------------------
+    def distancia(self, a, b):
+        """Menor número de passos de a até b; -1 se for parede ou inalcançável."""
+        i = self.indice[a[0] * self.cols + a[1]]
+        j = self.indice[b[0] * self.cols + b[1]]
+        if i < 0 or j < 0:
+            return -1
+        if i == j:
+            return 0
+        if i > j:
+            i, j = j, i
+        d = self.tabela[_inicio_linha(i, self.m) + j - i - 1]
+        return -1 if d == INALCANCAVEL else d
+
+    def alcancavel(self, a, b):
+        return self.distancia(a, b) >= 0
+
+    def adjacente(self, a, b):
+        """1 se a e b são vizinhos livres (a entrada da matriz de adjacência), senão 0."""
+        return 1 if self.distancia(a, b) == 1 else 0
+
+    def matriz_adjacencia(self):
+        """Mesma matriz n x n do criarMatrizAdjacencia (O(n²) de memória!)."""
+        n, cols = self.rows * self.cols, self.cols
+        matrix = [[0] * n for _ in range(n)]
+        for u in range(n):
+            if self.indice[u] < 0:
+                continue
+            r, c = divmod(u, cols)
+            for v in (u - cols, u + cols, u - 1 if c > 0 else -1, u + 1 if c < cols - 1 else -1):
+                if 0 <= v < n and self.adjacente((r, c), divmod(v, cols)):
+                    matrix[u][v] = 1
+        return matrix
+
+# ----------------------------------------------------
+# Abre a tabela de caminho se ela for deste labirinto; senão calcula antes
+# ----------------------------------------------------
+def carregar_ou_calcular(caminho, maze, processos=None):
+    if os.path.exists(caminho):
+        try:
+            return TabelaDistancias(caminho, maze)
+        except ValueError:
+            pass   # tabela velha ou corrompida: calcula de novo
+    calcular_tabela(maze, caminho, processos)
+    return TabelaDistancias(caminho, maze)
+
+def principal(argv):
+    if len(argv) < 2:
+        print("uso: python distancias.py labirinto tabela.dist [processos]")
+        return 2
+    lab = maze_io.carregar(argv[0])
+    processos = int(argv[2]) if len(argv) > 2 else None
+    inicio = time.perf_counter()
+    calcular_tabela(lab, argv[1], processos)
+    tempo = time.perf_counter() - inicio
+    with TabelaDistancias(argv[1], lab) as tabela:
+        print("%d células livres, %d pares em %.2fs (%.1f MB)"
+              % (tabela.m, tabela.m * (tabela.m - 1) // 2, tempo,
+                 os.path.getsize(argv[1]) / 1e6))
+        if lab.start is not None and lab.goal is not None:
+            print("distância start -> goal: %d" % tabela.distancia(lab.start, lab.goal))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(principal(sys.argv[1:]))
@@ -0,0 +1,192 @@
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+import main
+import maze_io
+from solver import bfs, NOMES_ESTADO
+
+# ----------------------------------------------------
+# Exportação de quadros sem janela (driver de vídeo "dummy" do SDL)
+#   - Roda o mesmo bfs_visual + animate_tree_path_reverse + animate_path
+#     do main.py, mas cada "espera pela seta" vira a captura de um quadro
+#     (main.capturar_quadro), sem interação do usuário
+#   - A compressão PNG de cada quadro vai para um pool de processos;
+#     o desenho continua enquanto os quadros anteriores são comprimidos
+#   - Saída: sequência de PNGs numa pasta por labirinto e, se pedido,
+#     um arquivo animado (GIF com Pillow ou MP4 com ffmpeg, opcionais)
+#
+#   python exportar.py saida/ [labirinto.txt|bin ...] [--gif|--mp4] [--fps N]
+# Sem labirintos, exporta o labirinto de exemplo do main.py.
+# ----------------------------------------------------
+
+# ----------------------------------------------------
+# PNG RGB 8 bits (só zlib, para rodar nos processos do pool)
+# ----------------------------------------------------
+def _bloco_png(tipo, dados):
+    bloco = tipo + dados
+    return struct.pack('>I', len(dados)) + bloco + struct.pack('>I', zlib.crc32(bloco))
+
+def codificar_png(largura, altura, rgb, nivel=6):
+    passo = 3 * largura
+    # Cada linha começa com o filtro 0 (nenhum)
+    linhas = b''.join(b'\x00' + rgb[y * passo:(y + 1) * passo] for y in range(altura))
+    return (b'\x89PNG\r\n\x1a\n'
+            + _bloco_png(b'IHDR', struct.pack('>IIBBBBB', largura, altura, 8, 2, 0, 0, 0))
+            + _bloco_png(b'IDAT', zlib.compress(linhas, nivel))
+            + _bloco_png(b'IEND', b''))
+
+def salvar_png(caminho, largura, altura, rgb):
+    with open(caminho, 'wb') as f:
+        f.write(codificar_png(largura, altura, rgb))
+    return caminho
+
+# ----------------------------------------------------
+# Captura os quadros de uma superfície e manda comprimir no pool
+#   - No máximo max_pendentes quadros crus ficam na memória esperando
+#     o pool; acima disso, a captura espera o quadro mais antigo
+# ----------------------------------------------------
+class ExportadorQuadros:
+    def __init__(self, pasta, executor, prefixo='quadro', max_pendentes=32):
+        self.pasta = pasta
+        self.executor = executor
+        self.prefixo = prefixo
+        self.max_pendentes = max_pendentes
+        self.caminhos = []
+        self._pendentes = deque()
+        os.makedirs(pasta, exist_ok=True)
+
+    def __call__(self, surface):
+        largura, altura = surface.get_size()
+        rgb = pygame.image.tobytes(surface, 'RGB')
+        caminho = os.path.join(self.pasta, '%s_%05d.png' % (self.prefixo, len(self.caminhos)))
+        self.caminhos.append(caminho)
+        self._pendentes.append(self.executor.submit(salvar_png, caminho, largura, altura, rgb))
+        while len(self._pendentes) > self.max_pendentes:
+            self._pendentes.popleft().result()
+
+    def concluir(self):
+        """Espera todos os quadros serem gravados; devolve os caminhos em ordem."""
+        while self._pendentes:
+            self._pendentes.popleft().result()
+        return self.caminhos
+
+# ----------------------------------------------------
+# Arquivos animados a partir da sequência de PNGs
+# ----------------------------------------------------
+def montar_gif(caminhos, destino, fps=4):
+    from PIL import Image   # Pillow só é necessário para o GIF
+    quadros = [Image.open(c) for c in caminhos]
+    quadros[0].save(destino, save_all=True, append_images=quadros[1:],
+                    duration=int(1000 / fps), loop=0)
+
+def montar_mp4(pasta, destino, fps=4, prefixo='quadro'):
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg não encontrado no PATH (necessário para --mp4)")
+    subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-framerate', str(fps),
+                    '-i', os.path.join(pasta, prefixo + '_%05d.png'),
+                    '-pix_fmt', 'yuv420p', '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', destino],
+                   check=True)
+
+# ----------------------------------------------------
+# Quadros de um labirinto (já ativo em main via usar_labirinto)
+# ----------------------------------------------------
+def _visao_geral(screen):
+    # Labirinto grande: um único quadro com a solução na visão com câmera
+    from camera import VisaoGrid
+    estado, path = bfs(main.maze, main.start, main.goal)
+    paleta = {codigo: main.color_map[nome] for codigo, nome in enumerate(NOMES_ESTADO)}
+    visao = VisaoGrid(screen, (0, 0, main.WIDTH, main.HEIGHT), main.ROWS, main.COLS, paleta,
+                      destaques={main.start: main.RED, main.goal: main.YELLOW},
+                      cor_fundo=main.BLACK, cor_texto=main.TEXT_COLOR)
+    visao.definir_caminho(path, main.GREEN)
+    visao.desenhar(estado.state)
+    pygame.display.update()
+    main.wait_for_right_key()
+
+def exportar_animacao(screen, exportador):
+    screen.fill(main.BLACK)
+    main.obter_grid_renderer(screen).invalidar()
+    main.capturar_quadro = exportador
+    try:
+        if main.labirinto_grande():
+            _visao_geral(screen)
+        else:
+            color, path, predecessor, dist = main.bfs_visual(screen)
+            if path:
+                main.animate_tree_path_reverse(screen, predecessor, dist, path)
+                main.animate_path(screen, color, path, predecessor, dist)
+    finally:
+        main.capturar_quadro = None
+    return exportador.concluir()
+
+# ----------------------------------------------------
+# Lote: um labirinto por vez na tela, todos dividindo o mesmo pool
+#   - Cada labirinto é fechado (mmap do .bin) logo depois de exportado
+#   - Arquivo inválido (ValueError do maze_io ou do usar_labirinto) é
+#     avisado e pulado, sem interromper o resto do lote
+# ----------------------------------------------------
+def exportar_lote(saida, arquivos, formato='png', fps=4, processos=None):
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    screen = pygame.display.set_mode((main.WIDTH, main.HEIGHT))
+    resultados = {}
+
+    def exportar(nome, executor):
+        pasta = os.path.join(saida, nome)
+        caminhos = exportar_animacao(screen, ExportadorQuadros(pasta, executor))
+        if formato == 'gif':
+            montar_gif(caminhos, os.path.join(saida, nome + '.gif'), fps)
+        elif formato == 'mp4':
+            montar_mp4(pasta, os.path.join(saida, nome + '.mp4'), fps)
+        resultados[nome] = caminhos
+
+    with ProcessPoolExecutor(processos) as executor:
+        for arquivo in arquivos or [None]:
+            if arquivo is None:
+                exportar('exemplo', executor)
+                continue
+            nome = os.path.splitext(os.path.basename(arquivo))[0]
+            try:
+                lab = maze_io.carregar(arquivo)
+            except ValueError as erro:
+                print("%s: ignorado (%s)" % (arquivo, erro))
+                continue
+            with lab:
+                try:
+                    main.usar_labirinto(lab)
+                except ValueError as erro:
+                    print("%s: ignorado (%s)" % (arquivo, erro))
+                    continue
+                exportar(nome, executor)
+    pygame.quit()
+    return resultados
+
+def principal(argv):
+    formato, fps, posicionais = 'png', 4, []
+    args = iter(argv)
+    for arg in args:
+        if arg in ('--gif', '--mp4'):
+            formato = arg[2:]
+        elif arg == '--fps':
+            fps = float(next(args))
+        else:
+            posicionais.append(arg)
+    if not posicionais:
+        print("uso: python exportar.py saida/ [labirinto ...] [--gif|--mp4] [--fps N]")
+        return 2
+    resultados = exportar_lote(posicionais[0], posicionais[1:], formato, fps)
+    for nome, caminhos in resultados.items():
+        print("%s: %d quadros" % (nome, len(caminhos)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(principal(sys.argv[1:]))
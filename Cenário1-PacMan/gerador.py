@@ -0,0 +1,219 @@
+import random
+import sys
+import time
+
+import maze_io
+from maze_io import Labirinto
+
+# ----------------------------------------------------
+# Geração de labirintos grandes (entradas de teste/estresse)
+#   - Tudo em bytearray (1 byte por célula, 1 -> parede), o mesmo
+#     buffer plano do maze_io.Labirinto: nada de listas de listas
+#   - Mesma semente -> mesmo labirinto
+#   - Labirintos "perfeitos" (backtracker, prim, kruskal): as salas ficam
+#     nas posições ímpares (2i + 1, 2j + 1) e as paredes entre elas são
+#     derrubadas; existe exatamente um caminho entre duas salas
+#   - abrir_lacos derruba paredes extras para criar ciclos (mais parecido
+#     com um mapa de Pac-Man)
+#   - aberto: campo livre com obstáculos sorteados com uma densidade
+#
+#   python gerador.py tipo rows cols saida.bin|txt [semente] [densidade|laços]
+# ----------------------------------------------------
+
+def _salas(rows, cols):
+    if rows < 3 or cols < 3:
+        raise ValueError("Labirinto muito pequeno: %dx%d (mínimo 3x3)" % (rows, cols))
+    return (rows - 1) // 2, (cols - 1) // 2
+
+def _novo(rows, cols, cells):
+    # start e goal nas salas dos cantos opostos
+    h, w = _salas(rows, cols)
+    return Labirinto(rows, cols, cells, (1, 1), (2 * h - 1, 2 * w - 1))
+
+# ----------------------------------------------------
+# Backtracker recursivo (DFS com pilha explícita): corredores longos
+# ----------------------------------------------------
+def backtracker(rows, cols, semente=None):
+    h, w = _salas(rows, cols)
+    sortear = random.Random(semente).random
+    cells = bytearray(b'\x01') * (rows * cols)
+    visitada = bytearray(h * w)
+
+    def celula(k):
+        i, j = divmod(k, w)
+        return (2 * i + 1) * cols + 2 * j + 1
+
+    visitada[0] = 1
+    cells[celula(0)] = 0
+    pilha = [0]
+    while pilha:
+        k = pilha[-1]
+        i, j = divmod(k, w)
+        opcoes = []
+        if i > 0 and not visitada[k - w]:
+            opcoes.append(k - w)
+        if i < h - 1 and not visitada[k + w]:
+            opcoes.append(k + w)
+        if j > 0 and not visitada[k - 1]:
+            opcoes.append(k - 1)
+        if j < w - 1 and not visitada[k + 1]:
+            opcoes.append(k + 1)
+        if not opcoes:
+            pilha.pop()
+            continue
+        v = opcoes[int(sortear() * len(opcoes))] if len(opcoes) > 1 else opcoes[0]
+        visitada[v] = 1
+        a, b = celula(k), celula(v)
+        cells[b] = 0
+        cells[(a + b) // 2] = 0   # parede entre as duas salas
+        pilha.append(v)
+    return _novo(rows, cols, cells)
+
+# ----------------------------------------------------
+# Prim aleatório: cresce a partir de uma sala sorteando paredes da
+# fronteira; muitos becos curtos
+# ----------------------------------------------------
+def prim(rows, cols, semente=None):
+    h, w = _salas(rows, cols)
+    rng = random.Random(semente)
+    sortear = rng.random
+    cells = bytearray(b'\x01') * (rows * cols)
+    dentro = bytearray(h * w)
+
+    def celula(k):
+        i, j = divmod(k, w)
+        return (2 * i + 1) * cols + 2 * j + 1
+
+    fronteira = []   # (sala de dentro, sala de fora)
+
+    def incluir(k):
+        dentro[k] = 1
+        cells[celula(k)] = 0
+        i, j = divmod(k, w)
+        if i > 0:
+            fronteira.append((k, k - w))
+        if i < h - 1:
+            fronteira.append((k, k + w))
+        if j > 0:
+            fronteira.append((k, k - 1))
+        if j < w - 1:
+            fronteira.append((k, k + 1))
+
+    incluir(rng.randrange(h * w))
+    while fronteira:
+        # Remove um item sorteado trocando com o último (O(1))
+        x = int(sortear() * len(fronteira))
+        item = fronteira[x]
+        fronteira[x] = fronteira[-1]
+        fronteira.pop()
+        k, v = item
+        if dentro[v]:
+            continue
+        cells[(celula(k) + celula(v)) // 2] = 0
+        incluir(v)
+    return _novo(rows, cols, cells)
+
+# ----------------------------------------------------
+# Kruskal aleatório: paredes embaralhadas + union-find entre as salas
+# ----------------------------------------------------
+def kruskal(rows, cols, semente=None):
+    h, w = _salas(rows, cols)
+    rng = random.Random(semente)
+    cells = bytearray(b'\x01') * (rows * cols)
+    for i in range(h):
+        base = (2 * i + 1) * cols
+        cells[base + 1:base + 2 * w:2] = bytes(w)   # todas as salas livres
+    pai = list(range(h * w))   # union-find (raízes achadas com compressão pela metade)
+
+    # Paredes: 2k -> entre k e k + 1 (direita); 2k + 1 -> entre k e k + w (baixo)
+    paredes = [2 * k for k in range(h * w) if k % w < w - 1]
+    paredes += [2 * k + 1 for k in range(h * w - w)]
+    rng.shuffle(paredes)
+    restantes = h * w - 1
+    for p in paredes:
+        k = p >> 1
+        rk = k
+        while pai[rk] != rk:
+            pai[rk] = rk = pai[pai[rk]]
+        rv = k + w if p & 1 else k + 1
+        while pai[rv] != rv:
+            pai[rv] = rv = pai[pai[rv]]
+        if rk == rv:
+            continue
+        pai[rk] = rv
+        i, j = divmod(k, w)
+        a = (2 * i + 1) * cols + 2 * j + 1
+        cells[a + cols if p & 1 else a + 1] = 0
+        restantes -= 1
+        if not restantes:
+            break
+    return _novo(rows, cols, cells)
+
+# ----------------------------------------------------
+# Derruba uma fração das paredes internas que separam duas salas
+# (cria ciclos num labirinto perfeito)
+# ----------------------------------------------------
+def abrir_lacos(lab, fracao, semente=None):
+    rng = random.Random(semente)
+    cols, cells = lab.cols, lab.cells
+    h, w = _salas(lab.rows, cols)
+    candidatas = []
+    for r in range(1, 2 * h):
+        # linha ímpar: entre salas lado a lado; par: entre salas empilhadas
+        for c in range(2 if r % 2 else 1, 2 * w, 2):
+            if cells[r * cols + c]:
+                candidatas.append(r * cols + c)
+    for u in rng.sample(candidatas, int(len(candidatas) * fracao)):
+        cells[u] = 0
+    return lab
+
+# ----------------------------------------------------
+# Campo aberto com obstáculos: cada célula vira parede com a probabilidade
+# `densidade` (em passos de 1/256); start (0, 0) e goal (rows-1, cols-1)
+# sempre livres. Bytes aleatórios + tabela de limiar: sem laço em Python
+# ----------------------------------------------------
+def aberto(rows, cols, semente=None, densidade=0.2):
+    limiar = round(densidade * 256)
+    tabela = bytes([1] * limiar + [0] * (256 - limiar))
+    cells = bytearray(random.Random(semente).randbytes(rows * cols).translate(tabela))
+    cells[0] = cells[-1] = 0
+    return Labirinto(rows, cols, cells, (0, 0), (rows - 1, cols - 1))
+
+GERADORES = {
+    'backtracker': backtracker,
+    'prim':        prim,
+    'kruskal':     kruskal,
+    'aberto':      aberto,
+}
+
+def gerar(tipo, rows, cols, semente=None, **kwargs):
+    if tipo not in GERADORES:
+        raise ValueError("Gerador desconhecido: %r (opções: %s)" % (tipo, ", ".join(GERADORES)))
+    return GERADORES[tipo](rows, cols, semente, **kwargs)
+
+def salvar(lab, caminho):
+    """Grava no formato lido pelo maze_io: binário (.bin) ou texto (outros)."""
+    escrever = maze_io.salvar_binario if caminho.endswith('.bin') else maze_io.salvar_texto
+    escrever(caminho, lab, lab.rows, lab.cols, lab.start, lab.goal)
+
+def principal(argv):
+    if len(argv) < 4:
+        print("uso: python gerador.py %s rows cols saida.bin|txt [semente] [densidade|laços]"
+              % "|".join(GERADORES))
+        return 2
+    tipo, rows, cols, saida = argv[0], int(argv[1]), int(argv[2]), argv[3]
+    semente = int(argv[4]) if len(argv) > 4 else None
+    extra = float(argv[5]) if len(argv) > 5 else None
+    inicio = time.perf_counter()
+    if tipo == 'aberto' and extra is not None:
+        lab = gerar(tipo, rows, cols, semente, densidade=extra)
+    else:
+        lab = gerar(tipo, rows, cols, semente)
+        if extra:
+            abrir_lacos(lab, extra, semente)
+    salvar(lab, saida)
+    print("%s %dx%d -> %s em %.2fs" % (tipo, rows, cols, saida, time.perf_counter() - inicio))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(principal(sys.argv[1:]))
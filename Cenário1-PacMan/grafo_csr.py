@@ -0,0 +1,96 @@
+from array import array
+
+from maze_io import Labirinto
+
+# ----------------------------------------------------
+# Grafo do labirinto em CSR (compressed sparse row)
+#   - offsets[u]..offsets[u+1] delimita os vizinhos de u em `vizinhos`
+#   - Paredes ficam sem vizinhos (como os [] do ListaAdj)
+#   - Memória O(n + arestas), em vez das O(n²) da matriz de adjacência
+#
+# Continua sendo um Labirinto (rows, cols, cells), então qualquer motor
+# do solver aceita um GrafoCSR no lugar do maze; bfs, bfs_bidirecional e
+# astar percorrem as listas do CSR em vez de calcular os vizinhos no grid.
+# O CSR é estático: se o labirinto mudar, é preciso montar de novo.
+# ----------------------------------------------------
+class GrafoCSR(Labirinto):
+    def __init__(self, rows, cols, cells, offsets, vizinhos, start=None, goal=None):
+        Labirinto.__init__(self, rows, cols, cells, start, goal)
+        self.offsets = offsets
+        self.vizinhos = vizinhos
+
+    # ------------------------------------------------
+    # Monta o CSR a partir de qualquer labirinto (lista de listas ou Labirinto),
+    # pulando as paredes. Vizinhos na ordem: cima, baixo, esquerda, direita.
+    # ------------------------------------------------
+    @classmethod
+    def from_maze(cls, maze):
+        cells = getattr(maze, 'cells', None)
+        if cells is not None:
+            rows, cols = maze.rows, maze.cols
+            cells = bytes(cells)
+        else:
+            rows, cols = len(maze), len(maze[0])
+            cells = b''.join(bytes(linha) for linha in maze)
+        n = rows * cols
+        ultima_linha = (rows - 1) * cols
+
+        offsets = array('i', [0]) * (n + 1)
+        vizinhos = array('i')
+        append = vizinhos.append
+        for u in range(n):
+            if not cells[u]:
+                c = u % cols
+                if u >= cols and not cells[u - cols]:
+                    append(u - cols)
+                if u < ultima_linha and not cells[u + cols]:
+                    append(u + cols)
+                if c > 0 and not cells[u - 1]:
+                    append(u - 1)
+                if c < cols - 1 and not cells[u + 1]:
+                    append(u + 1)
+            offsets[u + 1] = len(vizinhos)
+
+        return cls(rows, cols, cells, offsets, vizinhos,
+                   getattr(maze, 'start', None), getattr(maze, 'goal', None))
+
+    @property
+    def num_arestas(self):
+        return len(self.vizinhos) // 2   # não orientado: cada aresta aparece 2x
+
+    def vizinhos_de(self, u):
+        return self.vizinhos[self.offsets[u]:self.offsets[u + 1]]
+
+    def grau(self, u):
+        return self.offsets[u + 1] - self.offsets[u]
+
+    # ------------------------------------------------
+    # Exportações (só quando pedidas)
+    # ------------------------------------------------
+    def para_lista_adj(self):
+        """Mesmo formato do ListaAdj: {nó: [vizinhos]}, paredes com []."""
+        return {u: list(self.vizinhos_de(u)) for u in range(self.rows * self.cols)}
+
+    def para_matriz_densa(self):
+        """Matriz n x n de 0/1, como criarMatrizAdjacencia (O(n²) de memória!)."""
+        n = self.rows * self.cols
+        matrix = [[0] * n for _ in range(n)]
+        for u in range(n):
+            linha = matrix[u]
+            for v in self.vizinhos_de(u):
+                linha[v] = 1
+        return matrix
+
+    def para_matriz_bits(self):
+        """
+        Matriz de adjacência com 1 bit por par: n linhas de (n + 7) // 8 bytes.
+        O bit v da linha u fica no byte u * largura + v // 8, posição v % 8.
+        """
+        n = self.rows * self.cols
+        largura = (n + 7) // 8
+        bits = bytearray(n * largura)
+        for u in range(n):
+            base = u * largura
+            for v in self.vizinhos_de(u):
+                bits[base + (v >> 3)] |= 1 << (v & 7)
+        return bits
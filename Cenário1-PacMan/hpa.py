@@ -0,0 +1,263 @@
+import heapq
+
+from solver import bfs
+
+# ----------------------------------------------------
+# Busca hierárquica (estilo HPA*) para labirintos muito grandes
+#   - O grid é dividido em clusters de tamanho x tamanho células
+#   - Em cada borda entre dois clusters vizinhos, cada trecho contínuo
+#     de células livres dos dois lados vira uma "entrada": um par de
+#     nós abstratos (um de cada lado) ligados por uma aresta de custo 1
+#     (trechos curtos: uma entrada no meio; longos: uma em cada ponta)
+#   - Dentro de cada cluster, as distâncias entre os nós de entrada são
+#     pré-calculadas com o bfs do solver, só sobre o sub-grid do cluster
+#   - A consulta liga start e goal aos nós do próprio cluster, busca no
+#     grafo abstrato (pequeno) e depois refina cada trecho com o bfs
+#     dentro de um único cluster
+# O caminho é quase ótimo (as entradas fixas podem custar alguns passos).
+# Mudanças nas células refazem só os clusters afetados (atualizar).
+# ----------------------------------------------------
+
+TRECHO_LONGO = 6   # a partir deste comprimento, o trecho ganha duas entradas
+
+class AbstracaoHPA:
+    def __init__(self, maze, tamanho=16):
+        self.rows, self.cols = len(maze), len(maze[0])
+        # Cópia própria das células (diferente de 0 -> parede)
+        cells = getattr(maze, 'cells', None)
+        self.cells = bytearray(cells if cells is not None
+                               else b''.join(bytes(linha) for linha in maze))
+        self.tamanho = tamanho
+        self.clusters_linhas = -(-self.rows // tamanho)
+        self.clusters_colunas = -(-self.cols // tamanho)
+
+        self._bordas = {}   # (cluster, 'h'|'v') -> [(nó deste lado, nó do outro lado)]
+        self._inter = {}    # nó -> {nós ligados em outros clusters}
+        self._nos = {}      # cluster -> [nós de entrada]
+        self._intra = {}    # cluster -> {nó: {outro nó: distância}}
+        for k in range(self.clusters_linhas * self.clusters_colunas):
+            for direcao in ('h', 'v'):
+                self._montar_borda(k, direcao)
+        for k in range(self.clusters_linhas * self.clusters_colunas):
+            self._montar_cluster(k)
+
+    # ------------------------------------------------
+    # Geometria dos clusters
+    # ------------------------------------------------
+    def cluster_de(self, u):
+        r, c = divmod(u, self.cols)
+        return (r // self.tamanho) * self.clusters_colunas + c // self.tamanho
+
+    def limites(self, k):
+        """(r0, r1, c0, c1) do cluster k, r1/c1 exclusivos."""
+        cr, cc = divmod(k, self.clusters_colunas)
+        t = self.tamanho
+        return cr * t, min((cr + 1) * t, self.rows), cc * t, min((cc + 1) * t, self.cols)
+
+    def _sub_grid(self, k):
+        r0, r1, c0, c1 = self.limites(k)
+        cols, cells = self.cols, self.cells
+        return [cells[r * cols + c0:r * cols + c1] for r in range(r0, r1)]
+
+    # ------------------------------------------------
+    # Entradas na borda de baixo ('h') ou da direita ('v') do cluster k
+    # ------------------------------------------------
+    def _montar_borda(self, k, direcao):
+        r0, r1, c0, c1 = self.limites(k)
+        cols, cells = self.cols, self.cells
+        if direcao == 'h':
+            if r1 >= self.rows:
+                return
+            # pares (cima, baixo) ao longo da linha r1 - 1 / r1
+            pares = [((r1 - 1) * cols + c, r1 * cols + c) for c in range(c0, c1)]
+        else:
+            if c1 >= self.cols:
+                return
+            pares = [(r * cols + c1 - 1, r * cols + c1) for r in range(r0, r1)]
+
+        # Remove as entradas antigas desta borda
+        for a, b in self._bordas.pop((k, direcao), ()):
+            self._inter[a].discard(b)
+            self._inter[b].discard(a)
+
+        entradas = []
+        trecho = []
+        for a, b in pares + [(None, None)]:
+            if a is not None and not cells[a] and not cells[b]:
+                trecho.append((a, b))
+                continue
+            if trecho:
+                if len(trecho) >= TRECHO_LONGO:
+                    entradas += [trecho[0], trecho[-1]]
+                else:
+                    entradas.append(trecho[len(trecho) // 2])
+                trecho = []
+        for a, b in entradas:
+            self._inter.setdefault(a, set()).add(b)
+            self._inter.setdefault(b, set()).add(a)
+        self._bordas[(k, direcao)] = entradas
+
+    # ------------------------------------------------
+    # Nós de entrada do cluster k e distâncias entre eles (bfs no sub-grid)
+    # ------------------------------------------------
+    def _montar_cluster(self, k):
+        nos = sorted(u for u in self._nos_da_borda(k) if self._inter.get(u))
+        sub = self._sub_grid(k)
+        intra = {}
+        for u in nos:
+            intra[u] = self._distancias_locais(sub, k, u, nos)
+        self._nos[k] = nos
+        self._intra[k] = intra
+
+    def _nos_da_borda(self, k):
+        # Nós deste cluster que aparecem nas suas quatro bordas
+        cr, cc = divmod(k, self.clusters_colunas)
+        nos = set()
+        for chave, lado in (((k, 'h'), 0), ((k, 'v'), 0),
+                            ((k - self.clusters_colunas, 'h'), 1), ((k - 1, 'v'), 1)):
+            if lado == 1 and ((chave[1] == 'h' and cr == 0) or (chave[1] == 'v' and cc == 0)):
+                continue
+            for par in self._bordas.get(chave, ()):
+                nos.add(par[lado])
+        return nos
+
+    def _distancias_locais(self, sub, k, u, destinos):
+        """Distâncias (só dentro do cluster k) de u para os destinos alcançáveis."""
+        r0, r1, c0, c1 = self.limites(k)
+        largura, cols = c1 - c0, self.cols
+        r, c = divmod(u, cols)
+        estado, _ = bfs(sub, (r - r0, c - c0), (r - r0, c - c0))
+        dist = estado.dist
+        distancias = {}
+        for v in destinos:
+            d = dist[(v // cols - r0) * largura + v % cols - c0]
+            if d >= 0 and v != u:
+                distancias[v] = d
+        return distancias
+
+    # ------------------------------------------------
+    # Mudanças no labirinto: refaz só as bordas e clusters afetados
+    # ------------------------------------------------
+    def atualizar(self, mudancas):
+        """Aplica uma lista de (r, c, valor) e refaz os clusters afetados."""
+        t, ncc = self.tamanho, self.clusters_colunas
+        bordas, clusters = set(), set()
+        for r, c, valor in mudancas:
+            u = r * self.cols + c
+            valor = 1 if valor else 0
+            if self.cells[u] == valor:
+                continue
+            self.cells[u] = valor
+            k = self.cluster_de(u)
+            clusters.add(k)
+            # Célula na borda do cluster: a borda e o vizinho também mudam
+            if r % t == t - 1 and r + 1 < self.rows:
+                bordas.add((k, 'h'))
+                clusters.add(k + ncc)
+            if r % t == 0 and r > 0:
+                bordas.add((k - ncc, 'h'))
+                clusters.add(k - ncc)
+            if c % t == t - 1 and c + 1 < self.cols:
+                bordas.add((k, 'v'))
+                clusters.add(k + 1)
+            if c % t == 0 and c > 0:
+                bordas.add((k - 1, 'v'))
+                clusters.add(k - 1)
+        for k, direcao in bordas:
+            self._montar_borda(k, direcao)
+        for k in clusters:
+            self._montar_cluster(k)
+        return clusters
+
+    def definir_celula(self, r, c, valor):
+        return self.atualizar([(r, c, valor)])
+
+    # ------------------------------------------------
+    # Consulta
+    # ------------------------------------------------
+    @property
+    def num_nos(self):
+        return sum(len(nos) for nos in self._nos.values())
+
+    def _ligar(self, u):
+        """Arestas temporárias de u (start/goal) para os nós do seu cluster."""
+        k = self.cluster_de(u)
+        return self._distancias_locais(self._sub_grid(k), k, u, self._nos[k])
+
+    def caminho_abstrato(self, start, goal):
+        """Sequência de nós abstratos (índices) de start a goal, ou []."""
+        cols = self.cols
+        s = start[0] * cols + start[1]
+        g = goal[0] * cols + goal[1]
+        if self.cells[s] or self.cells[g]:
+            return []
+        if s == g:
+            return [s]
+
+        arestas_s = self._ligar(s)
+        arestas_g = self._ligar(g)
+        k = self.cluster_de(s)
+        if k == self.cluster_de(g):   # mesmo cluster: o caminho local também concorre
+            arestas_s.update(self._distancias_locais(self._sub_grid(k), k, s, [g]))
+        gr, gc = goal
+
+        def h(u):
+            r, c = divmod(u, cols)
+            return abs(r - gr) + abs(c - gc)
+
+        custo = {s: 0}
+        pred = {s: None}
+        heap = [(h(s), 0, s)]
+        fechados = set()
+        while heap:
+            _, du, u = heapq.heappop(heap)
+            if u in fechados:
+                continue
+            fechados.add(u)
+            if u == g:
+                break
+            # Arestas do grafo abstrato (vazias se u não é entrada) + temporárias
+            vizinhos = list(self._intra[self.cluster_de(u)].get(u, {}).items())
+            vizinhos += [(v, 1) for v in self._inter.get(u, ())]
+            if u == s:
+                vizinhos += arestas_s.items()
+            if u in arestas_g:
+                vizinhos.append((g, arestas_g[u]))
+            for v, w in vizinhos:
+                dv = du + w
+                if dv < custo.get(v, dv + 1):
+                    custo[v] = dv
+                    pred[v] = u
+                    heapq.heappush(heap, (dv + h(v), dv, v))
+        if g not in fechados:
+            return []
+
+        nos = []
+        u = g
+        while u is not None:
+            nos.append(u)
+            u = pred[u]
+        nos.reverse()
+        return nos
+
+    def refinar(self, nos):
+        """Expande a sequência abstrata em células, trecho a trecho."""
+        if not nos:
+            return []
+        cols = self.cols
+        path = [divmod(nos[0], cols)]
+        for a, b in zip(nos, nos[1:]):
+            k = self.cluster_de(a)
+            if k != self.cluster_de(b):   # aresta entre clusters: células vizinhas
+                path.append(divmod(b, cols))
+                continue
+            r0, r1, c0, c1 = self.limites(k)
+            ar, ac = divmod(a, cols)
+            br, bc = divmod(b, cols)
+            _, trecho = bfs(self._sub_grid(k), (ar - r0, ac - c0), (br - r0, bc - c0),
+                            parar_no_goal=True)
+            path += [(r + r0, c + c0) for r, c in trecho[1:]]
+        return path
+
+    def caminho(self, start, goal):
+        return self.refinar(self.caminho_abstrato(start, goal))
@@ -0,0 +1,124 @@
+import importlib
+import os
+import random
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import maze_io
+from componentes import IndiceComponentes
+from grafo_csr import GrafoCSR
+from solver import MOTORES
+
+# ----------------------------------------------------
+# Consultas em lote (muitos pares start/goal do mesmo labirinto) num
+# pool de processos
+#   - O labirinto e o CSR (offsets + vizinhos) ficam uma única vez num
+#     bloco de multiprocessing.shared_memory; cada processo só recebe o
+#     nome do bloco e monta um GrafoCSR sobre ele, sem cópia nem pickle
+#   - Os pares vão em blocos; os resultados voltam conforme cada bloco
+#     termina (gerador), não na ordem de entrada
+#   - Pares em componentes diferentes (IndiceComponentes) são respondidos
+#     na hora, sem ir para o pool
+#
+#   python lote.py labirinto.txt|bin [num_pares] [processos] [motor]
+# ----------------------------------------------------
+
+# Layout do bloco: células (n bytes, alinhado a 4) | offsets (n + 1) | vizinhos
+def _layout(n, num_vizinhos):
+    inicio_offsets = (n + 3) // 4 * 4
+    inicio_vizinhos = inicio_offsets + 4 * (n + 1)
+    return inicio_offsets, inicio_vizinhos, inicio_vizinhos + 4 * num_vizinhos
+
+def _grafo_compartilhado(buf, rows, cols, num_vizinhos):
+    n = rows * cols
+    inicio_offsets, inicio_vizinhos, fim = _layout(n, num_vizinhos)
+    mv = memoryview(buf)
+    return GrafoCSR(rows, cols, mv[:n],
+                    mv[inicio_offsets:inicio_vizinhos].cast('i'),
+                    mv[inicio_vizinhos:fim].cast('i'))
+
+# Motores em módulos próprios: entram em MOTORES quando o módulo é importado
+_MOTORES_EM_MODULOS = ('bfs_numpy', 'bfs_bitset')
+
+# ----------------------------------------------------
+# Lado dos processos do pool
+# ----------------------------------------------------
+_grafo = None
+_motor = None
+_bloco = None
+
+def _iniciar_processo(nome, rows, cols, num_vizinhos, motor):
+    global _grafo, _motor, _bloco
+    _bloco = shared_memory.SharedMemory(name=nome)   # quem criou é quem apaga (unlink)
+    _grafo = _grafo_compartilhado(_bloco.buf, rows, cols, num_vizinhos)
+    if motor in _MOTORES_EM_MODULOS:
+        importlib.import_module(motor)   # registra o motor em MOTORES
+    _motor = MOTORES[motor]
+
+def _resolver_bloco(pares):
+    return [(i, _motor(_grafo, start, goal)[1]) for i, start, goal in pares]
+
+# ----------------------------------------------------
+# Gera (i, path) para cada par pares[i], conforme ficam prontos
+# ----------------------------------------------------
+def resolver_lote(maze, pares, motor='astar', processos=None, tamanho_bloco=64,
+                  componentes=None):
+    if motor not in MOTORES and motor not in _MOTORES_EM_MODULOS:
+        raise ValueError("Motor desconhecido: %r (opções: %s)" % (motor, ", ".join(MOTORES)))
+    csr = maze if getattr(maze, 'offsets', None) is not None else GrafoCSR.from_maze(maze)
+    if componentes is None:
+        componentes = IndiceComponentes(csr)
+    rows, cols = csr.rows, csr.cols
+    n = rows * cols
+    num_vizinhos = len(csr.vizinhos)
+
+    pendentes = []
+    for i, (start, goal) in enumerate(pares):
+        if componentes.alcancavel(start, goal):
+            pendentes.append((i, tuple(start), tuple(goal)))
+        else:
+            yield i, []
+    if not pendentes:
+        return
+
+    inicio_offsets, inicio_vizinhos, fim = _layout(n, num_vizinhos)
+    bloco = shared_memory.SharedMemory(create=True, size=max(1, fim))
+    try:
+        bloco.buf[:n] = bytes(csr.cells)
+        bloco.buf[inicio_offsets:inicio_vizinhos] = array('i', csr.offsets).tobytes()
+        bloco.buf[inicio_vizinhos:fim] = array('i', csr.vizinhos).tobytes()
+        with ProcessPoolExecutor(processos, initializer=_iniciar_processo,
+                                 initargs=(bloco.name, rows, cols, num_vizinhos, motor)) as executor:
+            futuros = [executor.submit(_resolver_bloco, pendentes[k:k + tamanho_bloco])
+                       for k in range(0, len(pendentes), tamanho_bloco)]
+            for futuro in as_completed(futuros):
+                for resultado in futuro.result():
+                    yield resultado
+    finally:
+        bloco.close()
+        bloco.unlink()
+
+def principal(argv):
+    if not argv:
+        print("uso: python lote.py labirinto [num_pares=1000] [processos] [motor=astar]")
+        return 2
+    lab = maze_io.carregar(argv[0])
+    num_pares = int(argv[1]) if len(argv) > 1 else 1000
+    processos = int(argv[2]) if len(argv) > 2 else None
+    motor = argv[3] if len(argv) > 3 else 'astar'
+    rng = random.Random(0)
+    livres = [i for i in range(lab.rows * lab.cols) if not lab.cells[i]]
+    pares = [(divmod(rng.choice(livres), lab.cols), divmod(rng.choice(livres), lab.cols))
+             for _ in range(num_pares)]
+    inicio = time.perf_counter()
+    encontrados = sum(1 for _, path in resolver_lote(lab, pares, motor, processos) if path)
+    tempo = time.perf_counter() - inicio
+    print("%d pares (%d com caminho) em %.2fs: %.0f consultas/s com %d processos"
+          % (num_pares, encontrados, tempo, num_pares / tempo, processos or os.cpu_count()))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(principal(sys.argv[1:]))
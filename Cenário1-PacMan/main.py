@@ -1,6 +1,13 @@
 import pygame
+import queue
 import sys
-from collections import deque
+import threading
+
+import maze_io
+from grafo_csr import GrafoCSR
+from rastro import DESCOBERTA, NOMES_ESTADO_RASTRO, ReprodutorRastro, gravar_bfs
+from render import GridRenderer, TreeLayout, desenhar_seta, geometria_seta
+from solver import bfs, GridState, NOMES_ESTADO
 
 # ----------------------------------------------------
 # Configurações da Janela
@@ -12,6 +19,10 @@ TREE_WIDTH = WIDTH - GRID_WIDTH  # 300px para a árvore (direita)
 ROWS, COLS = 5, 5
 CELL_SIZE = GRID_WIDTH // COLS
 
+# Abaixo deste tamanho de célula (ou se o grid não couber na altura),
+# o labirinto é mostrado na visão com câmera (zoom/pan), sem a árvore
+TAM_MINIMO_CELULA = 6
+
 # ----------------------------------------------------
 # Cores
 # ----------------------------------------------------
@@ -57,33 +68,9 @@ maze = [
 # 20  (X) 22  23  24
 
 # Lista de adjacencia:
-ListaAdj = {
-    0: [1, 5], 
-    1: [0, 2], 
-    2: [1, 3], 
-    3: [2, 8, 4], 
-    4: [3],       
-    5: [0, 10], 
-    6: [],       # (parede)
-    7: [],       # (parede)
-    8: [3, 13], 
-    9: [],       # (parede)
-    10: [5, 15], 
-    11: [],      # (parede)
-    12: [13, 17], 
-    13: [8, 12, 14], 
-    14: [13, 19], 
-    15: [10, 20], 
-    16: [],      # (parede)
-    17: [12, 22], 
-    18: [],      # (parede)
-    19: [14, 24], 
-    20: [15],
-    21: [],      # (parede)
-    22: [17, 23], 
-    23: [22, 24], 
-    24: [19, 23]
-}
+# Gerada a partir do maze (grafo_csr), então não precisa ser mantida à mão.
+# Ex.: 0: [5, 1], 3: [8, 2, 4], 6: [] (parede), 24: [19, 23]
+ListaAdj = GrafoCSR.from_maze(maze).para_lista_adj()
 # MATRIZ DE ADJACENCIA
 #  [ 
 #      00  01  02  03  04  05  06  07  08  09  10  11  12  13  14  15  16  17  18  19  20  21  22  23  24
@@ -114,6 +101,8 @@ ListaAdj = {
 # 24  [0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,  0,  1,  0]
 #  ]
 
+# (Para labirintos grandes use GrafoCSR.para_matriz_densa/para_matriz_bits,
+#  ou simplesmente as listas do CSR: a matriz n x n ocupa O(n²) de memória.)
 def criarMatrizAdjacencia(ListaAdj):
     n = len(ListaAdj)
     # Inicializa uma matriz n x n com zeros
@@ -152,105 +141,45 @@ color_map = {
 def node_index(r, c):
     return r * COLS + c
 
+# ----------------------------------------------------
+# Renderizador do grid (render.GridRenderer), criado uma vez por tela
+#   - Guarda as cores já desenhadas e os textos dos índices
+#   - Desenha o início (Fantasma) e o fim (Pac-Man) por cima
+# ----------------------------------------------------
+_grid_renderer = None
+
+def obter_grid_renderer(screen):
+    global _grid_renderer
+    r = _grid_renderer
+    destaques = {start: RED, goal: YELLOW}
+    if (r is None or r.screen is not screen or r.destaques != destaques
+            or (r.rows, r.cols, r.cell_size) != (ROWS, COLS, CELL_SIZE)):
+        _grid_renderer = GridRenderer(screen, ROWS, COLS, CELL_SIZE, color_map,
+                                      area=(0, 0, GRID_WIDTH, HEIGHT), destaques=destaques,
+                                      cor_fundo=BLACK, cor_texto=TEXT_COLOR)
+    return _grid_renderer
+
 # ----------------------------------------------------
 # Função para desenhar o grid na tela
 #   - Usa as cores de acordo com o dicionário color[]
-#   - Desenha também o número do nó dentro do quadrado
-#   - Desenha o início (Fantasma) e o fim (Pac-Man) por cima
+#   - Só redesenha as células que mudaram desde o último quadro
+#   - Devolve os retângulos alterados (para pygame.display.update(rects))
 # ----------------------------------------------------
 def draw_grid(screen, color):
-    # Fundo do grid
-    pygame.draw.rect(screen, BLACK, (0, 0, GRID_WIDTH, HEIGHT))
-    font = pygame.font.SysFont(None, 17) # Fonte pequena para texto nos nós
-    
-    for r in range(ROWS):
-        for c in range(COLS):
-            x = c * CELL_SIZE
-            y = r * CELL_SIZE
-            cell_state = color[(r, c)]
-            cell_color = color_map[cell_state]
-            
-            # Desenha o retângulo da célula
-            pygame.draw.rect(screen, cell_color, (x, y, CELL_SIZE, CELL_SIZE))
-            
-            # Escreve o índice do nó no centro da célula
-            text_surface = font.render(str(node_index(r, c)), True, TEXT_COLOR)
-            text_rect = text_surface.get_rect(center=(x + CELL_SIZE//2, y + CELL_SIZE//2))
-            screen.blit(text_surface, text_rect)
-    
-     # Desenha o início (fantasma) em vermelho   
-    sx, sy = start[1] * CELL_SIZE, start[0] * CELL_SIZE
-    pygame.draw.rect(screen, RED, (sx, sy, CELL_SIZE, CELL_SIZE))
-    s_text = font.render(str(node_index(start[0], start[1])), True, (0,0,0))
-    s_rect = s_text.get_rect(center=(sx + CELL_SIZE//2, sy + CELL_SIZE//2))
-    screen.blit(s_text, s_rect)
-    
-    # Desenha o destino (Pac-Man) em amarelo
-    gx, gy = goal[1] * CELL_SIZE, goal[0] * CELL_SIZE
-    pygame.draw.rect(screen, YELLOW, (gx, gy, CELL_SIZE, CELL_SIZE))
-    g_text = font.render(str(node_index(goal[0], goal[1])), True, (0,0,0))
-    g_rect = g_text.get_rect(center=(gx + CELL_SIZE//2, gy + CELL_SIZE//2))
-    screen.blit(g_text, g_rect)
+    renderer = obter_grid_renderer(screen)
+    renderer.atualizar(color)
+    return renderer.flush()
 
 # ----------------------------------------------------
 # Desenha uma linha com setinha
 # ----------------------------------------------------
-import math
 def draw_arrow(screen, start_pos, end_pos, color=(0,0,0), thickness=2, node_radius=TAM_No):
     """
     Desenha uma seta de start_pos para end_pos,
     encurtando o início e o fim para não sobrepor os círculos dos nós.
+    (A conta fica em render.geometria_seta; o TreeLayout guarda o resultado por aresta.)
     """
-    # Descompacta coordenadas
-    x1, y1 = start_pos
-    x2, y2 = end_pos
-
-    # Vetor direção (dx, dy)
-    dx = x2 - x1
-    dy = y2 - y1
-
-    # Distância entre start e end
-    dist = math.hypot(dx, dy)
-
-    # Se dist for muito pequeno, evita divisão por zero
-    if dist < 2 * node_radius:
-        return  # Nós muito próximos ou sobrepostos, não desenha a seta
-
-    # Normaliza (dx, dy) para obter direção unitária
-    ux = dx / dist
-    uy = dy / dist
-
-    # "Encurtar" no início e no fim do vetor
-    # Início: avança node_radius pixels a partir de start
-    # Fim: recua node_radius pixels antes de end
-    new_start = (x1 + node_radius * ux, y1 + node_radius * uy)
-    new_end   = (x2 - node_radius * ux, y2 - node_radius * uy)
-
-    # Desenha a linha principal
-    pygame.draw.line(screen, color, new_start, new_end, thickness)
-
-    # Para desenhar a ponta da seta, calculamos novamente
-    # o ponto final "real" da linha (onde começa a flecha):
-    arrow_tip = new_end
-    # Tamanho da setinha
-    arrow_len = 10
-    arrow_angle = math.pi / 6  # ~30 graus
-
-    # Ângulo da linha
-    angle = math.atan2(y2 - y1, x2 - x1)
-    # Ponta esquerda
-    left_x = arrow_tip[0] - arrow_len * math.cos(angle - arrow_angle)
-    left_y = arrow_tip[1] - arrow_len * math.sin(angle - arrow_angle)
-    # Ponta direita
-    right_x = arrow_tip[0] - arrow_len * math.cos(angle + arrow_angle)
-    right_y = arrow_tip[1] - arrow_len * math.sin(angle + arrow_angle)
-
-    # Desenha o triângulo da seta
-    pygame.draw.polygon(screen, color, [
-        arrow_tip,
-        (left_x, left_y),
-        (right_x, right_y)
-    ])
+    desenhar_seta(screen, geometria_seta(start_pos, end_pos, node_radius), color, thickness)
 
 # ----------------------------------------------------
 # Desenha a "árvore" do BFS no lado direito,
@@ -321,156 +250,247 @@ def draw_tree(screen, predecessor, dist):
         # ou criar um dicionário de posições ao desenhar as camadas.
         # Vamos criar esse dicionário agora para não repetir lógica:
     
-def draw_tree_with_positions(screen, predecessor, dist):
-    """Versão que salva posições (x,y) dos nós para desenhar as arestas."""
+# ----------------------------------------------------
+# Layout da árvore (render.TreeLayout) compartilhado pelos desenhos abaixo
+# ----------------------------------------------------
+_tree_layout = None
+
+def novo_tree_layout():
+    global _tree_layout
+    _tree_layout = TreeLayout(COLS, GRID_WIDTH + TREE_WIDTH // 2, topo=30,
+                              espacamento_camada=EspacamentoCamadaNos,
+                              espacamento_nos=EspacamentoEntreNos,
+                              raio=TAM_No, tamanho_fonte=TAM_FonteNo)
+    return _tree_layout
+
+def obter_tree_layout(predecessor, dist):
+    """Reaproveita o layout se ele já foi montado para estes mesmos dicionários."""
+    if _tree_layout is None or not _tree_layout.vinculado(predecessor, dist):
+        novo_tree_layout().sincronizar(predecessor, dist)
+    return _tree_layout
+
+def desenhar_arvore(screen, layout, green_nodes=frozenset(), inverter=False):
     tree_area = pygame.Rect(GRID_WIDTH, 0, TREE_WIDTH, HEIGHT)
     pygame.draw.rect(screen, (220, 220, 220), tree_area)
-    
-    font = pygame.font.SysFont(None, TAM_FonteNo)
-    
-    # Agrupa nós por distância
-    layers = {}
-    for node, d in dist.items():
-        if d is not None:
-            layers.setdefault(d, []).append(node)
-    
-    max_dist = max(d for d in dist.values() if d is not None) if dist else 0
-    layer_spacing = EspacamentoCamadaNos
-    node_spacing  = EspacamentoEntreNos
-    center_x      = GRID_WIDTH + TREE_WIDTH // 2
-    
-    # Dicionário que guardará a posição de cada nó
-    positions = {}
-    
-    # Desenha camadas e nós
-    for d in range(max_dist+1):
-        if d not in layers:
-            continue
-        layer_nodes = layers[d]
-        y = 30 + d * layer_spacing
-        k = len(layer_nodes)
-        start_x = center_x - (k-1)*node_spacing//2
-        
-        for i, node in enumerate(layer_nodes):
-            x = start_x + i*node_spacing
-            # Armazena posição
-            positions[node] = (x, y)
-            # Desenha círculo
-            pygame.draw.circle(screen, (0,0,255), (x, y), TAM_No)
-            # Desenha índice
-            idx = node_index(*node)
-            text_surface = font.render(str(idx), True, (255,255,255))
-            text_rect = text_surface.get_rect(center=(x, y))
-            screen.blit(text_surface, text_rect)
-    
-    # Desenha arestas (setas)
-    for node, pred in predecessor.items():
-        if pred is None:
-            continue
-        if node in positions and pred in positions:
-            start_pos = positions[node]
-            end_pos   = positions[pred]
-            draw_arrow(screen, start_pos, end_pos, color=(0,0,0), thickness=2, node_radius=TAM_No)
+    layout.desenhar(screen, verdes=green_nodes, inverter_verdes=inverter, cor_destaque=GREEN)
+    return tree_area
 
-# ----------------------------------------------------
-# Retorna os vizinhos válidos (4 direções)
-# ----------------------------------------------------
-def get_neighbors(r, c):
-    direcoes = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Lista de movimentos: cima, baixo, esquerda e direita
-    for dr, dc in direcoes:                        # Itera sobre cada direção
-        nr, nc = r + dr, c + dc                     # Calcula a nova linha (nr) e nova coluna (nc) para o vizinho
-        if 0 <= nr < ROWS and 0 <= nc < COLS:        # Verifica se as coordenadas estão dentro dos limites do grid
-            yield nr, nc                           # Se estiverem, retorna (gera) esse vizinho
-            # o yield é bom pra economizar memoria
+def draw_tree_with_positions(screen, predecessor, dist):
+    """Versão que salva posições (x,y) dos nós para desenhar as arestas."""
+    desenhar_arvore(screen, obter_tree_layout(predecessor, dist))
 
 # ----------------------------------------------------
 # Espera a tecla seta para a direita
+#   - pygame.event.wait() bloqueia até chegar um evento (sem gastar CPU)
+#   - Se a janela for redesenhada pelo sistema, repõe a imagem atual
 # ----------------------------------------------------
+EVENTOS_EXPOSICAO = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+# Quando definido (ex.: exportar.py), cada espera vira a captura de um
+# quadro da tela, sem esperar o usuário
+capturar_quadro = None
+
 def wait_for_right_key():
-    waiting = True
-    while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RIGHT:
-                    waiting = False
+    if capturar_quadro is not None:
+        capturar_quadro(pygame.display.get_surface())
+        return
+    while True:
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        if event.type in EVENTOS_EXPOSICAO:
+            pygame.display.update()
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RIGHT:
+            return
+
+# ----------------------------------------------------
+# Roda uma busca longa numa thread separada, mantendo a janela responsiva
+#   - tarefa(avisar) faz o trabalho; avisar(texto) manda o andamento
+#   - A thread coloca (tipo, valor) na fila e posta EVENTO_PROGRESSO só
+#     para acordar o pygame.event.wait() daqui; a tela é redesenhada
+#     apenas quando chega uma mensagem nova
+#   - Fechar a janela encerra o programa (a thread é daemon)
+# ----------------------------------------------------
+EVENTO_PROGRESSO = pygame.USEREVENT + 2
+
+def mostrar_mensagem(screen, texto):
+    screen.fill(BLACK)
+    font = pygame.font.SysFont(None, TAM_FonteNo)
+    surf = font.render(texto, True, WHITE)
+    screen.blit(surf, surf.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
+    pygame.display.update()
+
+def executar_em_segundo_plano(screen, tarefa, titulo):
+    fila = queue.Queue()
+
+    def enviar(tipo, valor):
+        fila.put((tipo, valor))
+        pygame.event.post(pygame.event.Event(EVENTO_PROGRESSO))
+
+    def trabalhador():
+        try:
+            enviar('fim', tarefa(lambda texto: enviar('progresso', texto)))
+        except BaseException as erro:
+            enviar('erro', erro)
+
+    threading.Thread(target=trabalhador, daemon=True).start()
+    mostrar_mensagem(screen, titulo)
+    while True:
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        if event.type in EVENTOS_EXPOSICAO:
+            pygame.display.update()
+        if event.type != EVENTO_PROGRESSO:
+            continue
+        ultimo = None
+        while not fila.empty():
+            tipo, valor = fila.get_nowait()
+            if tipo == 'fim':
+                return valor
+            if tipo == 'erro':
+                raise valor
+            ultimo = valor
+        if ultimo is not None:
+            mostrar_mensagem(screen, "%s %s" % (titulo, ultimo))
+
+def aviso_de_progresso(avisar, total):
+    """on_progress para o bfs: manda a porcentagem de nós finalizados."""
+    return lambda finalizados, estado: avisar("%d%%" % (100 * finalizados // total))
 
 # ----------------------------------------------------
 # BFS passo a passo (aguardando seta), e guarda distâncias
+#   - A busca em si é feita pelo solver headless (solver.bfs)
+#   - Aqui apenas consumimos cada passo para desenhar e esperar a tecla
 # ----------------------------------------------------
 def bfs_visual(screen):
-    # Inicialização
-    color = {}
-    predecessor = {}
-    queue = deque()
-    dist        = {}  # armazena distância do start
-    
-    # Define cor inicial de cada célula --> branco para caminho livre e preto para parede
-    for r in range(ROWS):
-        for c in range(COLS):
-            if maze[r][c] == 1:
-                color[(r, c)] = 'WALL'   # Parede
-            else:
-                color[(r, c)] = 'WHITE'  # Não visitado
-            dist[(r,c)]  = None
-
-    
-    
-    # Nó inicial
-    color[start] = 'GRAY'
-    predecessor[start] = None  # o pai do nó inicial não é ninguém
-    dist[start] = 0
-    queue.append(start)
-    
-    found = False
-    # Loop BFS
-    while queue:
-        u = queue.popleft()  # desempilha (próximo nó a analisar vizinhos)
-        
-        # Se chegamos no goal
-        if u == goal:
-            found = True
-            # (não necessariamente paramos BFS aqui se quiser visitar todos)
-            #break
-        
-        # Explora vizinhos
-        for v in get_neighbors(*u):
-            if color[v] == 'WHITE':  # Ainda não descoberto
-                color[v] = 'GRAY'
-                predecessor[v] = u
-                dist[v] = dist[u] + 1 if dist[u] is not None else 0
-                queue.append(v)
-        
-        # Terminamos de explorar u (todos os vizinhos de u foram descobertos)
-        color[u] = 'BLACK'
-        
-        # Desenha a cada passo e espera a tecla
-        draw_grid(screen, color)
-        draw_tree_with_positions(screen, predecessor, dist)
-        pygame.display.update()
+    renderer = obter_grid_renderer(screen)
+    layout = novo_tree_layout()
+    renderer.atualizar(GridState.from_maze(maze).color_dict())  # estado inicial
+
+    def desenhar_passo(u, novos, estado):
+        # Só u e os recém-descobertos mudam de cor (e entram na árvore) neste passo
+        if not layout:
+            layout.adicionar(estado.coords(u), 0)
+        for v in novos:
+            layout.adicionar(estado.coords(v), estado.dist[v], estado.coords(u))
+        for v in [u] + novos:
+            renderer.definir(estado.coords(v), NOMES_ESTADO[estado.state[v]])
+        rects = renderer.flush()
+        tree_area = desenhar_arvore(screen, layout)
+        pygame.display.update(rects + [tree_area])
         wait_for_right_key()  # Aguardar seta → para avançar
-    
 
-    # Reconstruir o caminho se encontrado
-    path = []                           # Cria uma lista vazia para armazenar o caminho encontrado
-    if found:                           # Se o objetivo (goal) foi alcançado no BFS
-        node = goal                     # Inicia a reconstrução a partir do nó de destino (goal)
-        while node is not None:         # Enquanto houver um nó (até chegar ao início, onde predecessor é None)
-            path.append(node)           # Adiciona o nó atual à lista do caminho
-            node = predecessor[node]    # Atualiza o nó atual para o seu predecessor (nó anterior no caminho)
-    path.reverse()                      # Inverte a lista, para que o caminho fique na ordem correta: do início (start) ao destino (goal)
+    estado, path = bfs(maze, start, goal, on_step=desenhar_passo)
+    predecessor, dist = estado.predecessor_dict(), estado.dist_dict()
+    layout.vincular(predecessor, dist)   # as animações seguintes reaproveitam o layout
+    return estado.color_dict(), path, predecessor, dist
 
+# ----------------------------------------------------
+# Reprodução de um rastro gravado (rastro.py): a busca já rodou inteira,
+# aqui só navegamos pelos eventos
+#   →: próximo passo (no fim, segue para as animações do caminho)
+#   ←: passo anterior    Espaço: play/pause    ↑/↓: mais/menos rápido
+#   Home/End: início/fim    PgUp/PgDn: volta/avança 10%    Enter/Esc: sair
+# ----------------------------------------------------
+EVENTO_TOCAR = pygame.USEREVENT + 1
+
+def reproduzir_rastro(screen, rastro, estado):
+    reprodutor = ReprodutorRastro(rastro)
+    renderer = obter_grid_renderer(screen)
+    coords = estado.coords
+    layout = novo_tree_layout()
+
+    def adicionar_na_arvore(no, pred):
+        layout.adicionar(coords(no), estado.dist[no], coords(pred) if pred >= 0 else None)
+
+    def remontar():
+        # Depois de voltar/saltar: estado inteiro e árvore refeita até a posição
+        nonlocal layout
+        layout = novo_tree_layout()
+        renderer.atualizar({coords(i): NOMES_ESTADO_RASTRO[s] for i, s in enumerate(reprodutor.state)})
+        for p in range(reprodutor.pos):
+            tipo, no, extra = rastro.evento(p)
+            if tipo == DESCOBERTA:
+                adicionar_na_arvore(no, extra)
+
+    def aplicar(eventos):
+        for tipo, no, extra in eventos:
+            renderer.definir(coords(no), NOMES_ESTADO_RASTRO[reprodutor.state[no]])
+            if tipo == DESCOBERTA:
+                adicionar_na_arvore(no, extra)
+
+    def desenhar():
+        rects = renderer.flush()
+        tree_area = desenhar_arvore(screen, layout)
+        pygame.display.update(rects + [tree_area])
+
+    velocidade = 4.0   # passos por segundo no modo play
+    tocando = False
+    remontar()
+    desenhar()
+    while True:
+        event = pygame.event.wait()
+        mudancas = []
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        elif event.type == EVENTO_TOCAR:
+            mudancas = reprodutor.proximo_passo()
+            if reprodutor.no_fim:
+                tocando = False
+                pygame.time.set_timer(EVENTO_TOCAR, 0)
+        elif event.type == pygame.KEYDOWN:
+            um_decimo = max(1, rastro.num_eventos // 10)
+            if event.key == pygame.K_RIGHT:
+                if reprodutor.no_fim:
+                    break
+                mudancas = reprodutor.proximo_passo()
+            elif event.key == pygame.K_LEFT:
+                mudancas = reprodutor.passo_anterior()
+            elif event.key == pygame.K_SPACE:
+                tocando = not tocando and not reprodutor.no_fim
+            elif event.key == pygame.K_UP:
+                velocidade = min(velocidade * 2, 1000.0)
+            elif event.key == pygame.K_DOWN:
+                velocidade = max(velocidade / 2, 0.25)
+            elif event.key == pygame.K_HOME:
+                mudancas = reprodutor.ir_para(0)
+            elif event.key == pygame.K_END:
+                mudancas = reprodutor.ir_para(rastro.num_eventos)
+            elif event.key == pygame.K_PAGEUP:
+                mudancas = reprodutor.ir_para(reprodutor.pos - um_decimo)
+            elif event.key == pygame.K_PAGEDOWN:
+                mudancas = reprodutor.ir_para(reprodutor.pos + um_decimo)
+            elif event.key in (pygame.K_RETURN, pygame.K_ESCAPE):
+                break
+            if event.key in (pygame.K_SPACE, pygame.K_UP, pygame.K_DOWN):
+                pygame.time.set_timer(EVENTO_TOCAR, int(1000 / velocidade) if tocando else 0)
+        elif event.type in EVENTOS_EXPOSICAO:
+            pygame.display.update()
+            continue
+        else:
+            continue
 
-    
-    return color, path, predecessor, dist
+        if mudancas is None:
+            remontar()
+        elif mudancas:
+            aplicar(mudancas)
+        else:
+            continue
+        desenhar()
+
+    pygame.time.set_timer(EVENTO_TOCAR, 0)
 
 # ----------------------------------------------------
 # Anima o caminho final no grid (aguardando seta)
 # ----------------------------------------------------
 def animate_path(screen, color, path, predecessor, dist):
     # Para cada nó no caminho, atualizamos sua cor para 'PATH' e aguardamos a tecla
+    renderer = obter_grid_renderer(screen)
+    renderer.atualizar(color)
     i = 0
     for node in path:
         if i == 0:
@@ -481,9 +501,11 @@ def animate_path(screen, color, path, predecessor, dist):
         i += 1
 
         #color[node] = 'PATH'
-        draw_grid(screen, color)
+        renderer.definir(node, color[node])
+        if i > 1:
+            renderer.definir(path[i - 2], color[path[i - 2]])
         #draw_tree_with_positions(screen, predecessor, dist)
-        pygame.display.update()
+        pygame.display.update(renderer.flush())
         wait_for_right_key()
 
 def inverter_setas_verdes(screen, predecessor, dist, green_nodes):
@@ -492,52 +514,7 @@ def inverter_setas_verdes(screen, predecessor, dist, green_nodes):
     para as arestas cujos dois nós (o nó e seu predecessor) pertencem ao caminho verde.
     As demais arestas permanecem na orientação normal.
     """
-    tree_area = pygame.Rect(GRID_WIDTH, 0, TREE_WIDTH, HEIGHT)
-    pygame.draw.rect(screen, (220,220,220), tree_area)
-    
-    font = pygame.font.SysFont(None, TAM_FonteNo)
-    layers = {}
-    for node, d in dist.items():
-        if d is not None:
-            layers.setdefault(d, []).append(node)
-    
-    max_dist = max(d for d in dist.values() if d is not None) if dist else 0
-    layer_spacing = EspacamentoCamadaNos
-    node_spacing  = EspacamentoEntreNos
-    center_x = GRID_WIDTH + TREE_WIDTH // 2
-    positions = {}
-    
-    # Recalcula as posições de cada nó na árvore
-    for d in range(max_dist+1):
-        if d not in layers:
-            continue
-        layer_nodes = layers[d]
-        y = 30 + d * layer_spacing
-        k = len(layer_nodes)
-        start_x = center_x - (k-1) * node_spacing // 2
-        for i, node in enumerate(layer_nodes):
-            x = start_x + i * node_spacing
-            positions[node] = (x, y)
-            # Desenha o nó: se faz parte do caminho verde, pinta de verde; senão, azul.
-            node_color = GREEN if node in green_nodes else (0,0,255)
-            pygame.draw.circle(screen, node_color, (x, y), TAM_No)
-            idx = node_index(*node)
-            text_surface = font.render(str(idx), True, (255,255,255))
-            text_rect = text_surface.get_rect(center=(x, y))
-            screen.blit(text_surface, text_rect)
-    
-    # Desenha as setas: inverte a direção somente se ambos os nós estão no caminho verde.
-    for node, pred in predecessor.items():
-        if pred is None:
-            continue
-        if node in positions and pred in positions:
-            if node in green_nodes and pred in green_nodes:
-                # Inverte a seta: desenha de (posição do nó) para (posição do predecessor)
-                draw_arrow(screen, positions[pred], positions[node], color=GREEN, thickness=2, node_radius=TAM_No)
-            else:
-                # Desenha normalmente: de predecessor para o nó
-                draw_arrow(screen, positions[node], positions[pred], color=(0,0,0), thickness=2, node_radius=TAM_No)
-    
+    desenhar_arvore(screen, obter_tree_layout(predecessor, dist), green_nodes, inverter=True)
     pygame.display.update()
 
 
@@ -551,63 +528,15 @@ def animate_tree_path_reverse(screen, predecessor, dist, path):
     """
     # Conjunto para armazenar os nós que já foram animados (pintados de verde)
     green_nodes = set()
-    
+    layout = obter_tree_layout(predecessor, dist)
+
     # Percorre o caminho em ordem reversa (do goal para o start)
     for node in reversed(path):
         green_nodes.add(node)
-        
-        # Re-desenha a área do grafo com os nós atualizados:
-        # Utiliza a mesma lógica de draw_tree_with_positions, mas se o nó estiver no conjunto green_nodes,
-        # ele será desenhado com a cor GREEN; caso contrário, com a cor azul (0, 0, 255).
-        tree_area = pygame.Rect(GRID_WIDTH, 0, TREE_WIDTH, HEIGHT)
-        pygame.draw.rect(screen, (220, 220, 220), tree_area)
-    
-        font = pygame.font.SysFont(None, TAM_FonteNo)
-    
-        # Agrupa os nós por distância (camadas)
-        layers = {}
-        for node_key, d in dist.items():
-            if d is not None:
-                layers.setdefault(d, []).append(node_key)
-    
-        max_dist = max(d for d in dist.values() if d is not None) if dist else 0
-        layer_spacing = EspacamentoCamadaNos
-        node_spacing  = EspacamentoEntreNos
-        center_x      = GRID_WIDTH + TREE_WIDTH // 2
-    
-        positions = {}
-    
-        # Desenha cada camada de nós
-        for d in range(max_dist + 1):
-            if d not in layers:
-                continue
-            layer_nodes = layers[d]
-            y = 30 + d * layer_spacing
-            k = len(layer_nodes)
-            start_x = center_x - (k - 1) * node_spacing // 2
-            for i, node_key in enumerate(layer_nodes):
-                x = start_x + i * node_spacing
-                positions[node_key] = (x, y)
-                # Se o nó estiver no conjunto green_nodes, ele é desenhado em verde; caso contrário, em azul.
-                node_color = GREEN if node_key in green_nodes else (0, 0, 255)
-                pygame.draw.circle(screen, node_color, (x, y), TAM_No)
-                idx = node_index(*node_key)
-                text_surface = font.render(str(idx), True, (255, 255, 255))
-                text_rect = text_surface.get_rect(center=(x, y))
-                screen.blit(text_surface, text_rect)
-    
-        # Desenha as setas (arestas) entre os nós conforme os predecessores
-        for node_key, pred in predecessor.items():
-            if pred is None:
-                continue
-            if node_key in positions and pred in positions:
-                # Se tanto o nó quanto seu predecessor estão no caminho animado (green_nodes), a seta fica verde;
-                # caso contrário, permanece preta.
-                arrow_color = GREEN if (node_key in green_nodes and pred in green_nodes) else (0, 0, 0)
-                start_pos = positions[pred]
-                end_pos = positions[node_key]
-                draw_arrow(screen, end_pos, start_pos, color=arrow_color, thickness=2, node_radius=TAM_No)
-    
+
+        # Re-desenha a área do grafo: nós em green_nodes ficam verdes, os demais azuis;
+        # setas entre dois nós verdes também ficam verdes
+        desenhar_arvore(screen, layout, green_nodes)
         pygame.display.update()
         wait_for_right_key()  # Aguarda o pressionamento da seta para avançar o próximo passo
 
@@ -615,14 +544,126 @@ def animate_tree_path_reverse(screen, predecessor, dist, path):
     inverter_setas_verdes(screen, predecessor, dist, green_nodes)
     wait_for_right_key()
 # ----------------------------------------------------
+# Labirintos grandes: resolve sem animação e abre a visão com câmera
+#   - Roda do mouse: zoom em torno do cursor; arrastar: mover
+#   - Setas: mover; +/-: zoom; Home: ver tudo; Esc: sair
+# ----------------------------------------------------
+def labirinto_grande():
+    return CELL_SIZE < TAM_MINIMO_CELULA or ROWS * CELL_SIZE > HEIGHT
+
+def visualizar_labirinto_grande(screen):
+    from camera import VisaoGrid   # NumPy só é necessário neste modo
+
+    estado, path = executar_em_segundo_plano(
+        screen,
+        lambda avisar: bfs(maze, start, goal, on_progress=aviso_de_progresso(avisar, ROWS * COLS)),
+        "Resolvendo o labirinto...")
+    paleta = {codigo: color_map[nome] for codigo, nome in enumerate(NOMES_ESTADO)}
+    visao = VisaoGrid(screen, (0, 0, WIDTH, HEIGHT), ROWS, COLS, paleta,
+                      destaques={start: RED, goal: YELLOW},
+                      cor_fundo=BLACK, cor_texto=TEXT_COLOR)
+    visao.definir_caminho(path, GREEN)
+    camera = visao.camera
+
+    pygame.display.update(visao.desenhar(estado.state))
+    while True:
+        mudou = False
+        # Espera o próximo evento e junta os que já estão na fila (ex.: arrasto)
+        for event in [pygame.event.wait()] + pygame.event.get():
+            if event.type == pygame.QUIT:
+                return
+            if event.type in EVENTOS_EXPOSICAO:
+                mudou = True
+            elif event.type == pygame.MOUSEWHEEL:
+                camera.aproximar(1.25 ** event.y, pygame.mouse.get_pos())
+                mudou = True
+            elif event.type == pygame.MOUSEMOTION and event.buttons[0]:
+                camera.mover(-event.rel[0], -event.rel[1])
+                mudou = True
+            elif event.type == pygame.KEYDOWN:
+                passo_x, passo_y = camera.largura // 10, camera.altura // 10
+                if event.key == pygame.K_ESCAPE:
+                    return
+                elif event.key == pygame.K_LEFT:
+                    camera.mover(-passo_x, 0)
+                elif event.key == pygame.K_RIGHT:
+                    camera.mover(passo_x, 0)
+                elif event.key == pygame.K_UP:
+                    camera.mover(0, -passo_y)
+                elif event.key == pygame.K_DOWN:
+                    camera.mover(0, passo_y)
+                elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                    camera.aproximar(1.5)
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    camera.aproximar(1 / 1.5)
+                elif event.key == pygame.K_HOME:
+                    camera.enquadrar()
+                else:
+                    continue
+                mudou = True
+        if mudou:
+            pygame.display.update(visao.desenhar(estado.state))
+
+# ----------------------------------------------------
+# Troca o labirinto de exemplo por um carregado de arquivo (maze_io)
+#   - Arquivo sem S/G: start vira a primeira célula livre e goal a última
+#   - S/G fora do grid ou em parede: ValueError (nada é trocado)
+# ----------------------------------------------------
+def _celula_livre(lab, ultima=False):
+    linhas = range(lab.rows - 1, -1, -1) if ultima else range(lab.rows)
+    for r in linhas:
+        linha = bytes(lab[r])
+        c = linha.rfind(0) if ultima else linha.find(0)
+        if c >= 0:
+            return (r, c)
+    raise ValueError("Labirinto sem células livres")
+
+def _validar_celula(lab, cell, nome):
+    r, c = cell
+    if not (0 <= r < lab.rows and 0 <= c < lab.cols):
+        raise ValueError("%s %s fora do labirinto %dx%d" % (nome, cell, lab.rows, lab.cols))
+    if lab[r][c]:
+        raise ValueError("%s %s é uma parede" % (nome, cell))
+    return cell
+
+def usar_labirinto(lab):
+    global maze, ROWS, COLS, CELL_SIZE, start, goal
+    novo_start = _validar_celula(lab, lab.start if lab.start is not None
+                                 else _celula_livre(lab), "start")
+    novo_goal = _validar_celula(lab, lab.goal if lab.goal is not None
+                                else _celula_livre(lab, ultima=True), "goal")
+    maze = lab
+    ROWS, COLS = lab.rows, lab.cols
+    CELL_SIZE = GRID_WIDTH // COLS
+    start, goal = novo_start, novo_goal
+
+# ----------------------------------------------------
 # Main
+#   python main.py                 -> labirinto de exemplo acima
+#   python main.py arquivo.txt|bin -> labirinto carregado com maze_io
 # ----------------------------------------------------
 def main():
+    if len(sys.argv) > 1:
+        usar_labirinto(maze_io.carregar(sys.argv[1]))
+
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("BFS com Visualização de Árvore em Camadas")
-    # 1) Executa o BFS com visualização
-    color, path, predecessor, dist = bfs_visual(screen)
+    if labirinto_grande():
+        visualizar_labirinto_grande(screen)
+        pygame.quit()
+        sys.exit()
+
+    # 1) Executa o BFS uma vez (sem esperar teclas), gravando o rastro,
+    #    e depois reproduz o rastro com os controles de navegação
+    #    (numa thread, para a janela continuar respondendo em buscas longas)
+    rastro, estado, path = executar_em_segundo_plano(
+        screen,
+        lambda avisar: gravar_bfs(maze, start, goal,
+                                  on_progress=aviso_de_progresso(avisar, ROWS * COLS)),
+        "Gravando a busca...")
+    reproduzir_rastro(screen, rastro, estado)
+    color, predecessor, dist = estado.color_dict(), estado.predecessor_dict(), estado.dist_dict()
     
     # 2) Anima o caminho final em verde, passo a passo com a tecla seta para a direita
     if path:
@@ -630,16 +671,14 @@ def main():
         animate_path(screen, color, path, predecessor, dist)
     
     # 3) Mantém a janela aberta até o usuário fechar
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-        
-        draw_grid(screen, color)
-        pygame.display.update()
-        pygame.time.wait(50)
-    
+    #    (nada muda mais: só espera eventos e repõe a imagem se preciso)
+    while True:
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            break
+        if event.type in EVENTOS_EXPOSICAO:
+            pygame.display.update()
+
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,186 @@
+import mmap
+import struct
+
+# ----------------------------------------------------
+# Leitura/escrita de labirintos em arquivo
+#
+# Formato texto: uma linha por linha do grid
+#   '0' ou '.' -> livre;  '1' ou '#' -> parede
+#   'S' -> start (livre); 'G' -> goal (livre)
+#
+# Formato binário ("empacotado"): cabeçalho + 1 byte por célula (0/1),
+# linha após linha, sem separadores. Como as células ficam contíguas,
+# o arquivo é aberto com mmap e os solvers leem direto do buffer mapeado.
+# ----------------------------------------------------
+
+MAGICO = b'LAB1'
+# mágico, rows, cols, start (r, c), goal (r, c); -1 quando não houver
+CABECALHO = struct.Struct('<4sIIiiii')
+
+# Tabelas para converter os caracteres do formato texto em 0/1
+_TABELA_TEXTO = bytes.maketrans(b'0.SG1#', b'\x00\x00\x00\x00\x01\x01')
+_CARACTERES_VALIDOS = b'0.SG1#'
+
+# ----------------------------------------------------
+# Labirinto em buffer plano (1 byte por célula, diferente de 0 -> parede)
+#   - Se comporta como a lista de listas `maze`: len(lab), lab[r][c],
+#     bytes(lab[r]) funcionam, mas cada linha é só uma "janela"
+#     (memoryview) sobre o buffer, sem cópia nem objetos por célula
+# ----------------------------------------------------
+class Labirinto:
+    def __init__(self, rows, cols, cells, start=None, goal=None, _arquivo=None, _mapa=None,
+                 custos=None):
+        self.rows, self.cols = rows, cols
+        self.cells = cells
+        self.start, self.goal = start, goal
+        self.custos = custos   # opcional: custo de entrar em cada célula (bfs_01/dijkstra_dial)
+        self._arquivo, self._mapa = _arquivo, _mapa
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, r):
+        if not 0 <= r < self.rows:
+            raise IndexError(r)
+        return memoryview(self.cells)[r * self.cols:(r + 1) * self.cols]
+
+    def __iter__(self):
+        celulas = memoryview(self.cells)
+        for r in range(self.rows):
+            yield celulas[r * self.cols:(r + 1) * self.cols]
+
+    def __array__(self, dtype=None, copy=None):
+        # Usado por np.asarray(lab) (ex.: bfs_numpy) sem passar por listas
+        import numpy as np
+        a = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.rows, self.cols)
+        return a.astype(dtype) if dtype is not None else a
+
+    def close(self):
+        # Linhas (lab[r]) ou np.asarray(lab) ainda vivos seguram o buffer:
+        # aí o mmap não pode ser fechado agora e fica para o coletor, que o
+        # fecha quando a última janela sumir. O arquivo pode fechar já
+        # (o mmap tem o próprio descritor).
+        if self._mapa is not None:
+            try:
+                self.cells.release()
+                self._mapa.close()
+            except BufferError:
+                pass
+            self._arquivo.close()
+            self._mapa = self._arquivo = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ----------------------------------------------------
+# Percorre o arquivo texto linha a linha (streaming) e gera as linhas
+# já convertidas para 0/1. Preenche info com rows, cols, start e goal.
+# ----------------------------------------------------
+def _ler_texto(caminho, info):
+    rows, cols = 0, None
+    info.update(rows=0, cols=None, start=None, goal=None)
+    with open(caminho, 'rb') as f:
+        for numero, linha in enumerate(f, 1):
+            linha = linha.rstrip(b'\r\n')
+            if not linha.strip():
+                continue
+            if linha.translate(None, _CARACTERES_VALIDOS):
+                raise ValueError("Linha %d: caractere inválido no labirinto" % numero)
+            if cols is None:
+                cols = info['cols'] = len(linha)
+            elif len(linha) != cols:
+                raise ValueError("Linha %d: esperado %d colunas, obtido %d" % (numero, cols, len(linha)))
+            if b'S' in linha:
+                info['start'] = (rows, linha.index(b'S'))
+            if b'G' in linha:
+                info['goal'] = (rows, linha.index(b'G'))
+            rows += 1
+            info['rows'] = rows
+            yield linha.translate(_TABELA_TEXTO)
+    if not rows:
+        raise ValueError("Arquivo de labirinto vazio: %s" % caminho)
+
+# ----------------------------------------------------
+# Carrega o formato texto num bytearray compacto (1 byte por célula)
+# ----------------------------------------------------
+def carregar_texto(caminho):
+    info = {}
+    cells = bytearray()
+    for celulas in _ler_texto(caminho, info):
+        cells += celulas
+    return Labirinto(info['rows'], info['cols'], cells, info['start'], info['goal'])
+
+# ----------------------------------------------------
+# Abre o formato binário com mmap (nada é copiado para a memória)
+# ----------------------------------------------------
+def abrir_binario(caminho):
+    arquivo = open(caminho, 'rb')
+    try:
+        mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # arquivo vazio
+        arquivo.close()
+        raise ValueError("Arquivo de labirinto vazio: %s" % caminho)
+    if len(mapa) < CABECALHO.size:
+        mapa.close()
+        arquivo.close()
+        raise ValueError("Arquivo de labirinto binário inválido: %s" % caminho)
+    magico, rows, cols, sr, sc, gr, gc = CABECALHO.unpack_from(mapa, 0)
+    if magico != MAGICO or len(mapa) < CABECALHO.size + rows * cols:
+        mapa.close()
+        arquivo.close()
+        raise ValueError("Arquivo de labirinto binário inválido: %s" % caminho)
+    cells = memoryview(mapa)[CABECALHO.size:CABECALHO.size + rows * cols]
+    start = (sr, sc) if sr >= 0 else None
+    goal = (gr, gc) if gr >= 0 else None
+    return Labirinto(rows, cols, cells, start, goal, _arquivo=arquivo, _mapa=mapa)
+
+# ----------------------------------------------------
+# Escreve o formato binário linha a linha (maze pode ser lista de listas,
+# Labirinto ou qualquer iterável de linhas 0/1)
+# ----------------------------------------------------
+def salvar_binario(caminho, linhas, rows, cols, start=None, goal=None):
+    sr, sc = start if start is not None else (-1, -1)
+    gr, gc = goal if goal is not None else (-1, -1)
+    with open(caminho, 'wb') as f:
+        f.write(CABECALHO.pack(MAGICO, rows, cols, sr, sc, gr, gc))
+        for linha in linhas:
+            f.write(bytes(linha))
+
+# ----------------------------------------------------
+# Escreve o formato texto ('.' livre, '#' parede, S e G), linha a linha
+# ----------------------------------------------------
+_TABELA_SAIDA = bytes.maketrans(b'\x00\x01', b'.#')
+
+def salvar_texto(caminho, linhas, rows, cols, start=None, goal=None):
+    with open(caminho, 'wb') as f:
+        for r, linha in enumerate(linhas):
+            texto = bytearray(bytes(linha).translate(_TABELA_SAIDA))
+            if start is not None and start[0] == r:
+                texto[start[1]] = ord('S')
+            if goal is not None and goal[0] == r:
+                texto[goal[1]] = ord('G')
+            f.write(texto + b'\n')
+
+# ----------------------------------------------------
+# Converte texto -> binário sem carregar o labirinto inteiro
+# (duas passadas: a primeira só mede o grid e acha S/G)
+# ----------------------------------------------------
+def converter_texto_para_binario(origem, destino):
+    info = {}
+    for _ in _ler_texto(origem, info):
+        pass
+    salvar_binario(destino, _ler_texto(origem, {}), info['rows'], info['cols'],
+                   info['start'], info['goal'])
+
+# ----------------------------------------------------
+# Abre qualquer um dos dois formatos (decide pelo número mágico)
+# ----------------------------------------------------
+def carregar(caminho):
+    with open(caminho, 'rb') as f:
+        inicio = f.read(len(MAGICO))
+    if inicio == MAGICO:
+        return abrir_binario(caminho)
+    return carregar_texto(caminho)
@@ -0,0 +1,160 @@
+import random
+import sys
+import time
+from array import array
+
+import maze_io
+from dinamico import BFSDinamico
+from solver import bfs, vizinhos_idx
+
+# ----------------------------------------------------
+# Simulação de perseguição: N fantasmas atrás de um Pac-Man que anda
+#   - A cada tick o Pac-Man anda uma célula e cada fantasma dá um passo
+#     em direção a ele
+#   - Uma única busca "ao contrário", com origem no Pac-Man, serve todos
+#     os fantasmas: o predecessor de cada célula aponta para o próximo
+#     passo rumo ao Pac-Man
+#   - Quando o Pac-Man anda, o campo só é atualizado até as células dos
+#     fantasmas (CampoReverso), reaproveitando os buffers do tick
+#     anterior. Com incremental=True, o campo é reparado pelo LPA* do
+#     dinamico.BFSDinamico; como um passo do Pac-Man muda em ±1 quase
+#     todas as distâncias, o reparo costuma sair mais caro que refazer
+#     a busca limitada (compare com perseguicao.py ... --incremental)
+# ----------------------------------------------------
+
+# ----------------------------------------------------
+# Campo de distâncias a partir do Pac-Man, limitado aos fantasmas
+#   - BFS que para assim que todas as células-alvo foram descobertas
+#     (o predecessor de um nó já é definitivo na descoberta)
+#   - dist/pred são alocados uma vez; a cada busca, só as células
+#     tocadas na anterior voltam para -1
+#   - Mesma interface usada de BFSDinamico: mover_start, proximo_idx
+# ----------------------------------------------------
+class CampoReverso:
+    def __init__(self, maze, start):
+        self.rows, self.cols = len(maze), len(maze[0])
+        n = self.rows * self.cols
+        self.paredes = bytearray(b''.join(bytes(linha) for linha in maze))
+        self.dist = array('i', [-1]) * n
+        self.pred = array('i', [-1]) * n
+        self._tocados = []
+        self.processados = 0
+        self.start = start
+
+    def mover_start(self, start, alvos=()):
+        rows, cols = self.rows, self.cols
+        paredes, dist, pred = self.paredes, self.dist, self.pred
+        for v in self._tocados:
+            dist[v] = -1
+        self.start = start
+        s = start[0] * cols + start[1]
+        if paredes[s]:
+            self._tocados = []
+            self.processados = 0
+            return
+        faltam = set(alvos)
+        faltam.discard(s)
+        dist[s], pred[s] = 0, -1
+        fila = self._tocados = [s]
+        ultima_linha = (rows - 1) * cols
+        i = 0
+        while i < len(fila) and faltam:
+            u = fila[i]
+            i += 1
+            du = dist[u] + 1
+            c = u % cols
+            for v in (u - cols if u >= cols else -1,
+                      u + cols if u < ultima_linha else -1,
+                      u - 1 if c > 0 else -1,
+                      u + 1 if c < cols - 1 else -1):
+                if v >= 0 and dist[v] < 0 and not paredes[v]:
+                    dist[v], pred[v] = du, u
+                    fila.append(v)
+                    faltam.discard(v)
+        self.processados = i
+
+    def proximo_idx(self, u):
+        return self.pred[u] if self.dist[u] >= 0 else -1
+
+class Perseguicao:
+    def __init__(self, maze, pacman, fantasmas, semente=None, incremental=False):
+        self.rows, self.cols = len(maze), len(maze[0])
+        self.campo = (BFSDinamico if incremental else CampoReverso)(maze, pacman)
+        self.pacman = pacman[0] * self.cols + pacman[1]
+        self.fantasmas = [r * self.cols + c for r, c in fantasmas]
+        self.rng = random.Random(semente)
+        self.ticks = 0
+        self.capturas = 0       # ticks em que algum fantasma pegou o Pac-Man
+        self.processados = 0    # nós processados no campo, somando todos os ticks
+        if not incremental:
+            self.campo.mover_start(pacman, self.fantasmas)
+
+    # ------------------------------------------------
+    # Política do Pac-Man: passeio aleatório (sobrescreva para outra)
+    # ------------------------------------------------
+    def proximo_pacman(self):
+        paredes = self.campo.paredes
+        livres = [v for v in vizinhos_idx(self.pacman, self.rows, self.cols) if not paredes[v]]
+        return self.rng.choice(livres) if livres else self.pacman
+
+    def tick(self):
+        """Avança um tick; devolve True se algum fantasma alcançou o Pac-Man."""
+        campo = self.campo
+        novo = self.proximo_pacman()
+        if novo != self.pacman:
+            self.pacman = novo
+            campo.mover_start(divmod(novo, self.cols), alvos=self.fantasmas)
+            self.processados += campo.processados
+
+        fantasmas = self.fantasmas
+        for i, u in enumerate(fantasmas):
+            v = campo.proximo_idx(u)
+            if v >= 0:
+                fantasmas[i] = v
+
+        self.ticks += 1
+        capturou = self.pacman in fantasmas
+        self.capturas += capturou
+        return capturou
+
+    def rodar(self, num_ticks):
+        """Roda num_ticks ticks e devolve a taxa em ticks por segundo."""
+        inicio = time.perf_counter()
+        for _ in range(num_ticks):
+            self.tick()
+        return num_ticks / max(time.perf_counter() - inicio, 1e-9)
+
+    def posicoes(self):
+        return divmod(self.pacman, self.cols), [divmod(u, self.cols) for u in self.fantasmas]
+
+# ----------------------------------------------------
+# Sorteia N fantasmas em células alcançáveis a partir do Pac-Man
+# ----------------------------------------------------
+def sortear_fantasmas(maze, pacman, n, semente=None):
+    estado, _ = bfs(maze, pacman, pacman)
+    alcancaveis = [i for i, d in enumerate(estado.dist) if d > 0]
+    rng = random.Random(semente)
+    return [estado.coords(rng.choice(alcancaveis)) for _ in range(n)] if alcancaveis else []
+
+# ----------------------------------------------------
+#   python perseguicao.py labirinto.txt|bin [fantasmas] [ticks] [--incremental]
+# ----------------------------------------------------
+def principal(argv):
+    incremental = '--incremental' in argv
+    argv = [a for a in argv if a != '--incremental']
+    if not argv:
+        print("uso: python perseguicao.py labirinto [fantasmas=4] [ticks=1000] [--incremental]")
+        return 2
+    lab = maze_io.carregar(argv[0])
+    n = int(argv[1]) if len(argv) > 1 else 4
+    num_ticks = int(argv[2]) if len(argv) > 2 else 1000
+    pacman = lab.goal if lab.goal is not None else (0, 0)
+    sim = Perseguicao(lab, pacman, sortear_fantasmas(lab, pacman, n, semente=0), semente=0,
+                      incremental=incremental)
+    taxa = sim.rodar(num_ticks)
+    print("%dx%d, %d fantasmas: %.0f ticks/s (%d capturas, %.0f nós processados/tick)"
+          % (lab.rows, lab.cols, n, taxa, sim.capturas, sim.processados / max(sim.ticks, 1)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(principal(sys.argv[1:]))
@@ -0,0 +1,187 @@
+import struct
+from array import array
+
+from solver import bfs, BRANCO, CINZA, PRETO, PAREDE, NOMES_ESTADO
+
+# ----------------------------------------------------
+# Rastro (trace) de execução da busca
+#   - A busca roda uma única vez, em velocidade máxima, e o gravador
+#     (usado como on_step) guarda cada evento num array('i') compacto:
+#     (tipo, nó, extra) -> descoberta (extra = predecessor),
+#     finalização e caminho
+#   - Para reproduzir em qualquer posição (inclusive para trás), o Rastro
+#     guarda quadros-chave periódicos do estado das cores; a posição
+#     pedida é montada a partir do quadro-chave anterior + os eventos
+#     (deltas) até ela
+# ----------------------------------------------------
+
+DESCOBERTA, FINALIZACAO, CAMINHO = 0, 1, 2
+
+# Estado extra (além de BRANCO/CINZA/PRETO/PAREDE) para as células do caminho
+ESTADO_CAMINHO = 4
+NOMES_ESTADO_RASTRO = NOMES_ESTADO + ('PATH',)   # mesmos nomes do color_map
+
+_ESTADO_DO_EVENTO = (CINZA, PRETO, ESTADO_CAMINHO)
+
+# Estado antes da busca: só paredes e células brancas
+_TABELA_INICIAL = bytes([BRANCO, BRANCO, BRANCO, PAREDE]) + bytes(252)
+
+_CABECALHO = struct.Struct('<4sIII')   # mágico, rows, cols, número de eventos
+_MAGICO = b'RAS2'
+
+# ----------------------------------------------------
+# Gravador: passe como on_step de solver.bfs e depois chame finalizar()
+# ----------------------------------------------------
+class GravadorRastro:
+    def __init__(self):
+        self.rows = self.cols = None
+        self.inicial = None
+        self.eventos = array('i')
+
+    def __call__(self, u, novos, estado):
+        if self.inicial is None:
+            self._iniciar(estado)
+            self._registrar(DESCOBERTA, u, -1)   # o start
+        for v in novos:
+            self._registrar(DESCOBERTA, v, u)
+        self._registrar(FINALIZACAO, u, -1)
+
+    def _iniciar(self, estado):
+        self.rows, self.cols = estado.rows, estado.cols
+        self.inicial = bytes(estado.state).translate(_TABELA_INICIAL)
+
+    def _registrar(self, tipo, no, extra):
+        self.eventos.extend((tipo, no, extra))
+
+    def finalizar(self, path, **kwargs):
+        """Acrescenta os eventos do caminho e monta o Rastro reproduzível."""
+        cols = self.cols
+        for r, c in path:
+            self._registrar(CAMINHO, r * cols + c, -1)
+        return Rastro(self.rows, self.cols, self.inicial, self.eventos, **kwargs)
+
+# ----------------------------------------------------
+# Atalho: roda o bfs gravando tudo; devolve (rastro, estado, path)
+# (on_progress é repassado ao bfs)
+# ----------------------------------------------------
+def gravar_bfs(maze, start, goal, on_progress=None, **kwargs):
+    gravador = GravadorRastro()
+    estado, path = bfs(maze, start, goal, on_step=gravador, on_progress=on_progress)
+    if gravador.inicial is None:   # o bfs não chegou a expandir nada
+        s = estado.node_index(*start)
+        if estado.state[s] == PAREDE:   # start parede: rastro sem eventos
+            gravador._iniciar(estado)
+        else:
+            gravador(s, [], estado)
+    return gravador.finalizar(path, **kwargs), estado, path
+
+class Rastro:
+    def __init__(self, rows, cols, inicial, eventos, max_quadros=32,
+                 max_bytes_quadros=256 * 1024 * 1024):
+        self.rows, self.cols = rows, cols
+        self.inicial = bytes(inicial)
+        self.eventos = eventos
+        self.num_eventos = len(eventos) // 3
+
+        # Quadros-chave: limitados em quantidade e em memória total
+        n = rows * cols
+        quadros = max(1, min(max_quadros, max_bytes_quadros // max(1, n)))
+        self.intervalo = max(1, -(-self.num_eventos // quadros))
+        self.quadros_chave = [self.inicial]
+        state = bytearray(self.inicial)
+        for pos in range(self.num_eventos):
+            self._aplicar(state, pos)
+            if (pos + 1) % self.intervalo == 0:
+                self.quadros_chave.append(bytes(state))
+
+    def evento(self, pos):
+        i = 3 * pos
+        return self.eventos[i], self.eventos[i + 1], self.eventos[i + 2]
+
+    def _aplicar(self, state, pos):
+        i = 3 * pos
+        state[self.eventos[i + 1]] = _ESTADO_DO_EVENTO[self.eventos[i]]
+
+    def estado_em(self, pos):
+        """Estado das cores depois dos `pos` primeiros eventos."""
+        k = pos // self.intervalo
+        state = bytearray(self.quadros_chave[k])
+        for p in range(k * self.intervalo, pos):
+            self._aplicar(state, p)
+        return state
+
+    # ------------------------------------------------
+    # Arquivo: cabeçalho + estado inicial + eventos
+    # (os quadros-chave são refeitos ao carregar)
+    # ------------------------------------------------
+    def salvar(self, caminho):
+        with open(caminho, 'wb') as f:
+            f.write(_CABECALHO.pack(_MAGICO, self.rows, self.cols, self.num_eventos))
+            f.write(self.inicial)
+            self.eventos.tofile(f)
+
+    @classmethod
+    def carregar(cls, caminho, **kwargs):
+        with open(caminho, 'rb') as f:
+            magico, rows, cols, num_eventos = _CABECALHO.unpack(f.read(_CABECALHO.size))
+            if magico != _MAGICO:
+                raise ValueError("Arquivo de rastro inválido: %s" % caminho)
+            inicial = f.read(rows * cols)
+            eventos = array('i')
+            eventos.fromfile(f, 3 * num_eventos)
+        return cls(rows, cols, inicial, eventos, **kwargs)
+
+# ----------------------------------------------------
+# Reprodutor: posição atual dentro do rastro + estado das cores nela
+#   - Avançar aplica só os eventos novos (e os devolve, para o desenho
+#     incremental); voltar ou saltar longe parte do quadro-chave
+#   - Um "passo" é o mesmo do bfs_visual: termina numa finalização
+# ----------------------------------------------------
+class ReprodutorRastro:
+    def __init__(self, rastro):
+        self.rastro = rastro
+        self.pos = 0
+        self.state = bytearray(rastro.inicial)
+
+    @property
+    def no_fim(self):
+        return self.pos >= self.rastro.num_eventos
+
+    def ir_para(self, pos):
+        """
+        Vai para a posição `pos` (número de eventos aplicados).
+        Devolve a lista de eventos aplicados ao avançar, ou None quando o
+        estado foi remontado (voltar/saltar) e tudo deve ser redesenhado.
+        """
+        rastro = self.rastro
+        pos = min(max(pos, 0), rastro.num_eventos)
+        if self.pos <= pos <= self.pos + rastro.intervalo:
+            aplicados = []
+            for p in range(self.pos, pos):
+                rastro._aplicar(self.state, p)
+                aplicados.append(rastro.evento(p))
+            self.pos = pos
+            return aplicados
+        self.state = rastro.estado_em(pos)
+        self.pos = pos
+        return None
+
+    def _fim_do_passo(self, pos):
+        # Primeira posição depois de uma finalização (ou de um evento de caminho)
+        rastro = self.rastro
+        while pos < rastro.num_eventos:
+            pos += 1
+            if rastro.eventos[3 * (pos - 1)] != DESCOBERTA:
+                break
+        return pos
+
+    def proximo_passo(self):
+        return self.ir_para(self._fim_do_passo(self.pos))
+
+    def passo_anterior(self):
+        # Volta ao fim do passo anterior ao atual
+        rastro = self.rastro
+        pos = self.pos - 1
+        while pos > 0 and rastro.eventos[3 * (pos - 1)] == DESCOBERTA:
+            pos -= 1
+        return self.ir_para(max(pos, 0))
@@ -0,0 +1,232 @@
+import math
+from bisect import insort
+
+import pygame
+
+# ----------------------------------------------------
+# Renderizador "retido" do grid
+#   - A fonte é criada uma única vez e o texto de cada índice de nó é
+#     renderizado só na primeira vez que aparece (cache de superfícies)
+#   - Guarda uma superfície de fundo com a imagem atual do grid
+#   - Só as células cujo estado mudou são redesenhadas; flush() devolve
+#     os retângulos alterados para pygame.display.update(rects)
+# Assim o custo de cada quadro depende do número de mudanças, não do grid.
+# ----------------------------------------------------
+class GridRenderer:
+    def __init__(self, screen, rows, cols, cell_size, color_map, area=None,
+                 destaques=None, cor_fundo=(0, 0, 0), cor_texto=(0, 0, 0), tamanho_fonte=17):
+        self.screen = screen
+        self.rows, self.cols = rows, cols
+        self.cell_size = cell_size
+        self.color_map = color_map
+        # Área da tela reservada ao grid (por padrão, só o próprio grid)
+        self.area = pygame.Rect(area if area is not None else (0, 0, cols * cell_size, rows * cell_size))
+        # Células desenhadas sempre com uma cor fixa (ex.: start e goal)
+        self.destaques = dict(destaques or {})
+        self.cor_fundo = cor_fundo
+        self.cor_texto = cor_texto
+
+        self.fundo = pygame.Surface(self.area.size)
+        self.fundo.fill(cor_fundo)
+        self._font = pygame.font.SysFont(None, tamanho_fonte)
+        self._rotulos = {}        # índice do nó -> superfície com o texto
+        self._estado = {}         # (r, c) -> estado desenhado por último
+        self._sujas = set()       # células a redesenhar no próximo flush
+        self._tudo = True         # primeiro flush copia o fundo inteiro
+
+    # ------------------------------------------------
+    # Marca mudanças de estado
+    # ------------------------------------------------
+    def definir(self, cell, estado):
+        if self._estado.get(cell) != estado:
+            self._estado[cell] = estado
+            self._sujas.add(cell)
+
+    def atualizar(self, color):
+        """Compara um dicionário color inteiro com o que já foi desenhado."""
+        for cell, estado in color.items():
+            self.definir(cell, estado)
+
+    def invalidar(self):
+        """Força a cópia do fundo inteiro no próximo flush (ex.: tela apagada)."""
+        self._tudo = True
+
+    # ------------------------------------------------
+    # Desenho
+    # ------------------------------------------------
+    def _rotulo(self, idx):
+        surf = self._rotulos.get(idx)
+        if surf is None:
+            surf = self._rotulos[idx] = self._font.render(str(idx), True, self.cor_texto)
+        return surf
+
+    def _desenhar_celula(self, r, c):
+        cs = self.cell_size
+        x, y = c * cs, r * cs
+        cor = self.destaques.get((r, c))
+        if cor is None:
+            cor = self.color_map[self._estado[(r, c)]]
+        pygame.draw.rect(self.fundo, cor, (x, y, cs, cs))
+        if cs >= 12:  # células muito pequenas ficam sem o número
+            texto = self._rotulo(r * self.cols + c)
+            self.fundo.blit(texto, texto.get_rect(center=(x + cs // 2, y + cs // 2)))
+        return pygame.Rect(self.area.x + x, self.area.y + y, cs, cs)
+
+    def flush(self):
+        """Desenha as células pendentes e devolve os retângulos alterados da tela."""
+        rects = [self._desenhar_celula(r, c) for r, c in self._sujas]
+        self._sujas.clear()
+        if self._tudo:
+            self._tudo = False
+            self.screen.blit(self.fundo, self.area)
+            return [self.area]
+        for rect in rects:
+            self.screen.blit(self.fundo, rect, rect.move(-self.area.x, -self.area.y))
+        return rects
+
+# ----------------------------------------------------
+# Geometria de uma seta de start_pos para end_pos, encurtada para não
+# sobrepor os círculos dos nós: (início, fim, triângulo da ponta),
+# ou None se os nós estiverem próximos demais.
+# ----------------------------------------------------
+def geometria_seta(start_pos, end_pos, node_radius, arrow_len=10, arrow_angle=math.pi / 6):
+    x1, y1 = start_pos
+    x2, y2 = end_pos
+    dx = x2 - x1
+    dy = y2 - y1
+    dist = math.hypot(dx, dy)
+    if dist < 2 * node_radius:
+        return None
+
+    ux = dx / dist
+    uy = dy / dist
+    new_start = (x1 + node_radius * ux, y1 + node_radius * uy)
+    new_end   = (x2 - node_radius * ux, y2 - node_radius * uy)
+
+    angle = math.atan2(y2 - y1, x2 - x1)
+    left  = (new_end[0] - arrow_len * math.cos(angle - arrow_angle),
+             new_end[1] - arrow_len * math.sin(angle - arrow_angle))
+    right = (new_end[0] - arrow_len * math.cos(angle + arrow_angle),
+             new_end[1] - arrow_len * math.sin(angle + arrow_angle))
+    return new_start, new_end, [new_end, left, right]
+
+def desenhar_seta(screen, geometria, color=(0, 0, 0), thickness=2):
+    if geometria is None:
+        return
+    new_start, new_end, ponta = geometria
+    pygame.draw.line(screen, color, new_start, new_end, thickness)
+    pygame.draw.polygon(screen, color, ponta)
+
+# ----------------------------------------------------
+# Layout incremental da árvore do BFS (camadas por distância)
+#   - Cada nó entra uma vez (adicionar) na camada da sua distância;
+#     só as camadas que ganharam nós têm as posições recalculadas
+#   - Dentro da camada, os nós ficam na ordem do índice (a mesma ordem
+#     em que o dicionário dist é percorrido)
+#   - A geometria de cada seta fica em cache por aresta e só é refeita
+#     quando um dos dois nós muda de posição
+# Serve para draw_tree_with_positions, animate_tree_path_reverse e
+# inverter_setas_verdes, que antes refaziam tudo a cada quadro.
+# ----------------------------------------------------
+class TreeLayout:
+    def __init__(self, cols, centro_x, topo=30, espacamento_camada=80, espacamento_nos=90,
+                 raio=30, tamanho_fonte=40):
+        self.cols = cols
+        self.centro_x, self.topo = centro_x, topo
+        self.espacamento_camada = espacamento_camada
+        self.espacamento_nos = espacamento_nos
+        self.raio = raio
+        self.tamanho_fonte = tamanho_fonte
+
+        self.camadas = {}        # distância -> nós da camada
+        self.dist = {}           # nó -> distância
+        self.predecessor = {}    # nó -> predecessor (None no start)
+        self.positions = {}      # nó -> (x, y)
+        self._camadas_sujas = set()
+        self._setas = {}         # (origem, destino) -> (pos. origem, pos. destino, geometria)
+        self._font = None
+        self._rotulos = {}
+        self._vinculo = None
+
+    def __len__(self):
+        return len(self.dist)
+
+    def adicionar(self, node, d, pred=None):
+        if node in self.dist:
+            return
+        self.dist[node] = d
+        self.predecessor[node] = pred
+        insort(self.camadas.setdefault(d, []), node)
+        self._camadas_sujas.add(d)
+
+    # ------------------------------------------------
+    # Usado quando só temos os dicionários predecessor/dist prontos.
+    # O layout fica "vinculado" a eles: chamadas seguintes com os mesmos
+    # dicionários reaproveitam tudo sem percorrê-los de novo.
+    # ------------------------------------------------
+    def sincronizar(self, predecessor, dist):
+        for node, d in dist.items():
+            if d is not None:
+                self.adicionar(node, d, predecessor.get(node))
+        self.vincular(predecessor, dist)
+
+    def vincular(self, predecessor, dist):
+        self._vinculo = (predecessor, dist)
+
+    def vinculado(self, predecessor, dist):
+        return (self._vinculo is not None
+                and self._vinculo[0] is predecessor and self._vinculo[1] is dist)
+
+    def posicoes(self):
+        for d in self._camadas_sujas:
+            camada = self.camadas[d]
+            y = self.topo + d * self.espacamento_camada
+            start_x = self.centro_x - (len(camada) - 1) * self.espacamento_nos // 2
+            for i, node in enumerate(camada):
+                self.positions[node] = (start_x + i * self.espacamento_nos, y)
+        self._camadas_sujas.clear()
+        return self.positions
+
+    def geometria(self, origem, destino):
+        positions = self.posicoes()
+        a, b = positions[origem], positions[destino]
+        item = self._setas.get((origem, destino))
+        if item is None or item[0] != a or item[1] != b:
+            item = (a, b, geometria_seta(a, b, self.raio))
+            self._setas[(origem, destino)] = item
+        return item[2]
+
+    def _rotulo(self, node):
+        surf = self._rotulos.get(node)
+        if surf is None:
+            if self._font is None:
+                self._font = pygame.font.SysFont(None, self.tamanho_fonte)
+            idx = node[0] * self.cols + node[1]
+            surf = self._rotulos[node] = self._font.render(str(idx), True, (255, 255, 255))
+        return surf
+
+    # ------------------------------------------------
+    # Desenha nós e setas (de cada nó para o seu predecessor).
+    # Nós em `verdes` usam cor_destaque; arestas com os dois nós verdes
+    # ficam verdes e, com inverter_verdes, apontam do predecessor para o nó.
+    # ------------------------------------------------
+    def desenhar(self, screen, verdes=frozenset(), inverter_verdes=False,
+                 cor_no=(0, 0, 255), cor_destaque=(60, 200, 60), cor_seta=(0, 0, 0)):
+        positions = self.posicoes()
+        for d in sorted(self.camadas):
+            for node in self.camadas[d]:
+                x, y = positions[node]
+                pygame.draw.circle(screen, cor_destaque if node in verdes else cor_no, (x, y), self.raio)
+                texto = self._rotulo(node)
+                screen.blit(texto, texto.get_rect(center=(x, y)))
+
+        for node, pred in self.predecessor.items():
+            if pred is None or pred not in positions:
+                continue
+            if node in verdes and pred in verdes:
+                if inverter_verdes:
+                    desenhar_seta(screen, self.geometria(pred, node), cor_destaque)
+                else:
+                    desenhar_seta(screen, self.geometria(node, pred), cor_destaque)
+            else:
+                desenhar_seta(screen, self.geometria(node, pred), cor_seta)
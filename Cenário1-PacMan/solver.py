@@ -0,0 +1,632 @@
+import heapq
+from array import array
+from collections import deque
+
+# ----------------------------------------------------
+# Motor de busca "headless" (sem pygame)
+#   - Pode ser usado em servidores sem tela
+#   - O desenho passo a passo fica a cargo de quem chama,
+#     através do callback on_step (veja bfs_visual no main.py)
+# ----------------------------------------------------
+
+# Lista de movimentos: cima, baixo, esquerda e direita
+DIRECOES = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+# ----------------------------------------------------
+# Estados das células (1 byte por célula no bytearray)
+# ----------------------------------------------------
+BRANCO, CINZA, PRETO, PAREDE = 0, 1, 2, 3
+NOMES_ESTADO = ('WHITE', 'GRAY', 'BLACK', 'WALL')  # mesmos nomes do color_map
+
+# Tabela para converter células 0/1 do labirinto em BRANCO/PAREDE
+_TABELA_PAREDES = bytes([BRANCO, PAREDE]) + bytes([PAREDE]) * 254
+
+# ----------------------------------------------------
+# Retorna os vizinhos válidos (4 direções) dentro de um grid rows x cols
+# ----------------------------------------------------
+def get_neighbors(r, c, rows, cols):
+    for dr, dc in DIRECOES:
+        nr, nc = r + dr, c + dc
+        if 0 <= nr < rows and 0 <= nc < cols:
+            yield nr, nc
+
+# ----------------------------------------------------
+# Mesma ideia, mas com índices de nó (r * cols + c)
+# ----------------------------------------------------
+def vizinhos_idx(u, rows, cols):
+    c = u % cols
+    if u >= cols:
+        yield u - cols
+    if u < (rows - 1) * cols:
+        yield u + cols
+    if c > 0:
+        yield u - 1
+    if c < cols - 1:
+        yield u + 1
+
+# ----------------------------------------------------
+# Função u -> vizinhos de u para o maze informado: se for um GrafoCSR
+# (grafo_csr.py), usa as listas do CSR; senão calcula no grid.
+# ----------------------------------------------------
+def funcao_vizinhos(maze, rows, cols):
+    offsets = getattr(maze, 'offsets', None)
+    if offsets is not None:
+        vizinhos = maze.vizinhos
+        return lambda u: vizinhos[offsets[u]:offsets[u + 1]]
+    return lambda u: vizinhos_idx(u, rows, cols)
+
+# ----------------------------------------------------
+# Estado compacto do grid, indexado por node_index(r, c)
+#   state -> bytearray com BRANCO/CINZA/PRETO/PAREDE
+#   dist  -> array('i'), -1 quando não alcançado
+#   pred  -> array('i'), índice do predecessor (-1 quando não há)
+# ----------------------------------------------------
+class GridState:
+    def __init__(self, rows, cols, state, dist=None, pred=None):
+        self.rows, self.cols = rows, cols
+        n = rows * cols
+        self.state = state
+        self.dist = dist if dist is not None else array('i', [-1]) * n
+        self.pred = pred if pred is not None else array('i', [-1]) * n
+
+    @classmethod
+    def from_maze(cls, maze):
+        cells = getattr(maze, 'cells', None)   # Labirinto do maze_io (buffer plano/mmap)
+        if cells is not None:
+            return cls(maze.rows, maze.cols, bytearray(cells).translate(_TABELA_PAREDES))
+        # bytes(linha) converte a linha 0/1 sem criar objetos por célula
+        state = bytearray(b''.join(bytes(linha) for linha in maze)).translate(_TABELA_PAREDES)
+        return cls(len(maze), len(maze[0]), state)
+
+    def node_index(self, r, c):
+        return r * self.cols + c
+
+    def coords(self, i):
+        return divmod(i, self.cols)
+
+    def expandidos(self):
+        """Quantidade de nós finalizados (expandidos) pela busca."""
+        return self.state.count(PRETO)
+
+    def caminho_idx(self, goal):
+        """Caminho (em índices) do start até goal, seguindo pred por saltos inteiros."""
+        if self.dist[goal] < 0:
+            return []
+        pred = self.pred
+        path = [goal]
+        node = pred[goal]
+        while node >= 0:
+            path.append(node)
+            node = pred[node]
+        path.reverse()
+        return path
+
+    def path_to(self, goal):
+        """Mesmo que caminho_idx, mas recebe e devolve tuplas (r, c)."""
+        cols = self.cols
+        return [divmod(i, cols) for i in self.caminho_idx(goal[0] * cols + goal[1])]
+
+    # ------------------------------------------------
+    # Conversões para os dicionários usados pela visualização
+    # ------------------------------------------------
+    def color_dict(self):
+        cols = self.cols
+        return {divmod(i, cols): NOMES_ESTADO[s] for i, s in enumerate(self.state)}
+
+    def predecessor_dict(self):
+        cols = self.cols
+        return {divmod(i, cols): (divmod(p, cols) if p >= 0 else None)
+                for i, p in enumerate(self.pred) if self.dist[i] >= 0}
+
+    def dist_dict(self):
+        cols = self.cols
+        return {divmod(i, cols): (d if d >= 0 else None) for i, d in enumerate(self.dist)}
+
+# ----------------------------------------------------
+# BFS puro sobre o GridState: recebe o labirinto (0 -> livre; 1 -> parede),
+# start e goal e devolve (estado, path).
+#
+# on_step(u, novos, estado) é chamado (se informado) sempre que um nó u
+# é finalizado; novos são os índices descobertos a partir de u.
+#
+# parar_no_goal=True encerra a busca assim que o goal é descoberto
+# (a distância dele já é definitiva nesse momento), em vez de explorar
+# toda a componente conexa do start. O caminho é o mesmo da busca completa.
+#
+# on_progress(finalizados, estado), mais leve que on_step, é chamado a cada
+# intervalo_progresso nós finalizados (ex.: para mostrar o andamento de uma
+# busca longa rodando em outra thread).
+#
+# Start ou goal em parede: nada é explorado e o path é vazio (como em
+# todos os motores de MOTORES).
+# ----------------------------------------------------
+def bfs(maze, start, goal, on_step=None, parar_no_goal=False, on_progress=None,
+        intervalo_progresso=65536):
+    estado = GridState.from_maze(maze)
+    rows, cols = estado.rows, estado.cols
+    state, dist, pred = estado.state, estado.dist, estado.pred
+    ultima_linha = (rows - 1) * cols
+    offsets = getattr(maze, 'offsets', None)   # GrafoCSR: vizinhos prontos
+    vizinhos = getattr(maze, 'vizinhos', None)
+
+    s = start[0] * cols + start[1]
+    g = goal[0] * cols + goal[1]
+    if state[s] == PAREDE or state[g] == PAREDE:
+        return estado, []
+    state[s] = CINZA
+    dist[s] = 0
+    queue = deque([s])
+    append, popleft = queue.append, queue.popleft
+    finalizados = 0
+    proximo_aviso = intervalo_progresso if on_progress is not None else -1
+
+    while queue:
+        u = popleft()
+        du = dist[u] + 1
+        if offsets is None:
+            # Explora vizinhos (cima, baixo, esquerda, direita)
+            c = u % cols
+            vs = (u - cols if u >= cols else -1,
+                  u + cols if u < ultima_linha else -1,
+                  u - 1 if c > 0 else -1,
+                  u + 1 if c < cols - 1 else -1)
+        else:
+            vs = vizinhos[offsets[u]:offsets[u + 1]]
+        for v in vs:
+            if v >= 0 and state[v] == BRANCO:  # Ainda não descoberto
+                state[v] = CINZA
+                pred[v] = u
+                dist[v] = du
+                append(v)
+
+        # Todos os vizinhos de u foram descobertos
+        state[u] = PRETO
+
+        if on_step is not None:
+            novos = [v for v in vizinhos_idx(u, rows, cols) if pred[v] == u]
+            on_step(u, novos, estado)
+
+        finalizados += 1
+        if finalizados == proximo_aviso:
+            on_progress(finalizados, estado)
+            proximo_aviso += intervalo_progresso
+
+        # Goal já descoberto (ou é parede): não há por que continuar
+        if parar_no_goal and state[g] != BRANCO:
+            break
+
+    path = estado.path_to(goal)
+    return estado, path
+
+# ----------------------------------------------------
+# BFS bidirecional: cresce uma fronteira a partir do start e outra a partir
+# do goal (sempre a menor das duas, uma camada inteira por vez) até que
+# se encontrem no meio.
+#
+# Devolve (estado, path) como o bfs: estado.dist/pred guardam a árvore do
+# lado do start, completada com o trecho do caminho vindo do lado do goal,
+# de modo que estado.path_to(goal) funciona normalmente.
+# ----------------------------------------------------
+def bfs_bidirecional(maze, start, goal):
+    estado = GridState.from_maze(maze)
+    rows, cols = estado.rows, estado.cols
+    state, dist_f, pred_f = estado.state, estado.dist, estado.pred
+    n = rows * cols
+    dist_b = array('i', [-1]) * n
+    pred_b = array('i', [-1]) * n
+
+    s = start[0] * cols + start[1]
+    g = goal[0] * cols + goal[1]
+    if state[s] == PAREDE or state[g] == PAREDE:
+        return estado, []
+
+    dist_f[s] = 0
+    dist_b[g] = 0
+    state[s] = state[g] = CINZA
+    if s == g:
+        return estado, [start]
+
+    viz = funcao_vizinhos(maze, rows, cols)
+    fronteira_f, fronteira_b = [s], [g]
+    encontro = None
+    while fronteira_f and fronteira_b and encontro is None:
+        if len(fronteira_f) <= len(fronteira_b):
+            fronteira_f, encontro = _expandir_camada(estado, viz, fronteira_f, dist_f, pred_f, dist_b)
+        else:
+            fronteira_b, encontro = _expandir_camada(estado, viz, fronteira_b, dist_b, pred_b, dist_f)
+            if encontro is not None:
+                encontro = (encontro[1], encontro[0])  # orienta como (lado start, lado goal)
+
+    if encontro is None:
+        return estado, []
+
+    # Completa a árvore do start com o trecho do lado do goal
+    u, v = encontro
+    while v >= 0:
+        pred_f[v] = u
+        dist_f[v] = dist_f[u] + 1
+        u, v = v, pred_b[v]
+
+    path = estado.path_to(goal)
+    return estado, path
+
+# ----------------------------------------------------
+# Expande uma camada inteira de um dos lados do BFS bidirecional.
+# Devolve a nova fronteira e a melhor aresta (u, v) que liga este lado
+# ao outro (ou None), escolhida pela menor soma das distâncias.
+# ----------------------------------------------------
+def _expandir_camada(estado, viz, fronteira, dist, pred, dist_outro):
+    state = estado.state
+    nova = []
+    melhor, encontro = -1, None
+    for u in fronteira:
+        du = dist[u] + 1
+        for v in viz(u):
+            if state[v] == PAREDE:
+                continue
+            if dist_outro[v] >= 0:
+                custo = du + dist_outro[v]
+                if melhor < 0 or custo < melhor:
+                    melhor, encontro = custo, (u, v)
+            if dist[v] < 0:
+                dist[v] = du
+                pred[v] = u
+                state[v] = CINZA
+                nova.append(v)
+        state[u] = PRETO
+    return nova, encontro
+
+# ----------------------------------------------------
+# A* com heurística de Manhattan (custo uniforme, 4 direções)
+#   - dist guarda o custo g de cada nó, pred o predecessor
+#   - CINZA -> na fila de prioridade; PRETO -> expandido
+#   - Empates em f são desfeitos pelo maior g (mais perto do goal)
+# ----------------------------------------------------
+def astar(maze, start, goal):
+    estado = GridState.from_maze(maze)
+    rows, cols = estado.rows, estado.cols
+    state, dist, pred = estado.state, estado.dist, estado.pred
+    gr, gc = goal
+
+    s = start[0] * cols + start[1]
+    g = gr * cols + gc
+    if state[s] == PAREDE or state[g] == PAREDE:
+        return estado, []
+    viz = funcao_vizinhos(maze, rows, cols)
+    dist[s] = 0
+    state[s] = CINZA
+    heap = [(abs(start[0] - gr) + abs(start[1] - gc), 0, s)]
+
+    while heap:
+        _, _, u = heapq.heappop(heap)
+        if state[u] == PRETO:   # entrada antiga na fila
+            continue
+        state[u] = PRETO
+        if u == g:
+            break
+        du = dist[u] + 1
+        for v in viz(u):
+            sv = state[v]
+            if sv == PAREDE or sv == PRETO:
+                continue
+            if dist[v] < 0 or du < dist[v]:
+                dist[v] = du
+                pred[v] = u
+                state[v] = CINZA
+                r, c = divmod(v, cols)
+                heapq.heappush(heap, (du + abs(r - gr) + abs(c - gc), -du, v))
+
+    path = estado.path_to(goal)
+    return estado, path
+
+# ----------------------------------------------------
+# Jump Point Search para grids de 4 direções e custo uniforme
+#   - Movimento horizontal: segue reto e só para no goal ou quando
+#     surge um vizinho forçado (célula acima/abaixo livre cuja
+#     vizinha "de trás" é parede)
+#   - Movimento vertical: a cada passo procura saltos horizontais
+#     para os dois lados; se algum achar um ponto de salto, a célula
+#     atual também é ponto de salto
+#   - A busca em si é um A* apenas sobre os pontos de salto; no fim,
+#     pred/dist são preenchidos célula a célula ao longo do caminho
+# ----------------------------------------------------
+def jps(maze, start, goal):
+    estado = GridState.from_maze(maze)
+    rows, cols = estado.rows, estado.cols
+    state, dist, pred = estado.state, estado.dist, estado.pred
+    gr, gc = goal
+
+    s = start[0] * cols + start[1]
+    g = gr * cols + gc
+    if state[s] == PAREDE or state[g] == PAREDE:
+        return estado, []
+
+    def livre(r, c):
+        return 0 <= r < rows and 0 <= c < cols and state[r * cols + c] != PAREDE
+
+    def salto_horizontal(r, c, dc):
+        while True:
+            c += dc
+            if not livre(r, c):
+                return None
+            if (r, c) == goal:
+                return r, c
+            if (livre(r - 1, c) and not livre(r - 1, c - dc)) or \
+               (livre(r + 1, c) and not livre(r + 1, c - dc)):
+                return r, c
+
+    def salto_vertical(r, c, dr):
+        while True:
+            r += dr
+            if not livre(r, c):
+                return None
+            if (r, c) == goal:
+                return r, c
+            if salto_horizontal(r, c, -1) or salto_horizontal(r, c, 1):
+                return r, c
+
+    def sucessores(u):
+        r, c = divmod(u, cols)
+        p = pred[u]
+        if p < 0:                       # start: as 4 direções
+            direcoes = DIRECOES
+        else:
+            pr, pc = divmod(p, cols)
+            dr = (r > pr) - (r < pr)
+            dc = (c > pc) - (c < pc)
+            if dr:                      # chegou na vertical
+                direcoes = [(dr, 0), (0, -1), (0, 1)]
+            else:                       # chegou na horizontal (+ forçados)
+                direcoes = [(0, dc)]
+                for dv in (-1, 1):
+                    if livre(r + dv, c) and not livre(r + dv, c - dc):
+                        direcoes.append((dv, 0))
+        for dr, dc in direcoes:
+            if dr:
+                jp = salto_vertical(r, c, dr)
+            else:
+                jp = salto_horizontal(r, c, dc)
+            if jp is not None:
+                yield jp[0] * cols + jp[1], abs(jp[0] - r) + abs(jp[1] - c)
+
+    dist[s] = 0
+    state[s] = CINZA
+    heap = [(abs(start[0] - gr) + abs(start[1] - gc), 0, s)]
+    while heap:
+        _, _, u = heapq.heappop(heap)
+        if state[u] == PRETO:
+            continue
+        state[u] = PRETO
+        if u == g:
+            break
+        for v, custo in sucessores(u):
+            if state[v] == PRETO:
+                continue
+            dv = dist[u] + custo
+            if dist[v] < 0 or dv < dist[v]:
+                dist[v] = dv
+                pred[v] = u
+                state[v] = CINZA
+                r, c = divmod(v, cols)
+                heapq.heappush(heap, (dv + abs(r - gr) + abs(c - gc), -dv, v))
+
+    if state[g] != PRETO:
+        return estado, []
+
+    # Preenche as células entre pontos de salto consecutivos
+    pontos = estado.caminho_idx(g)
+    for a, b in zip(pontos, pontos[1:]):
+        if a // cols == b // cols:      # mesma linha
+            passo = 1 if b > a else -1
+        else:                           # mesma coluna
+            passo = cols if b > a else -cols
+        u = a
+        while u != b:
+            v = u + passo
+            pred[v] = u
+            dist[v] = dist[u] + 1
+            if state[v] == BRANCO:
+                state[v] = CINZA
+            u = v
+
+    path = estado.path_to(goal)
+    return estado, path
+
+# ----------------------------------------------------
+# Terreno com custo por célula
+#   - custos[v] é o custo de ENTRAR na célula v (0 a 255); pode vir como
+#     argumento (lista de listas ou buffer plano, como o maze) ou do
+#     atributo maze.custos. Sem custos, toda célula livre custa 1.
+#   - dist guarda o custo acumulado; pred e a árvore são os mesmos que a
+#     visualização já desenha (predecessor_dict/dist_dict)
+# ----------------------------------------------------
+def _custos_planos(maze, custos):
+    if custos is None:
+        custos = getattr(maze, 'custos', None)
+    if custos is None:
+        return None
+    try:
+        return memoryview(custos).cast('B')   # buffer plano (bytes/bytearray/array('B'))
+    except TypeError:
+        return b''.join(bytes(linha) for linha in custos)
+
+# ----------------------------------------------------
+# BFS 0-1: custos só 0 ou 1. Deque no lugar da fila de prioridade:
+# aresta de custo 0 entra pela frente, de custo 1 por trás, e a deque
+# fica sempre ordenada por dist (no máximo dois valores nela)
+#   - Um nó pode entrar duas vezes; a cópia antiga é ignorada (PRETO)
+# ----------------------------------------------------
+def bfs_01(maze, start, goal, custos=None, parar_no_goal=False):
+    estado = GridState.from_maze(maze)
+    rows, cols = estado.rows, estado.cols
+    state, dist, pred = estado.state, estado.dist, estado.pred
+    custos = _custos_planos(maze, custos)
+    if custos is not None and max(custos, default=0) > 1:
+        raise ValueError("bfs_01 só aceita custos 0 ou 1 (use dijkstra_dial)")
+    ultima_linha = (rows - 1) * cols
+    offsets = getattr(maze, 'offsets', None)   # GrafoCSR: vizinhos prontos
+    vizinhos = getattr(maze, 'vizinhos', None)
+
+    s = start[0] * cols + start[1]
+    g = goal[0] * cols + goal[1]
+    if state[s] == PAREDE or state[g] == PAREDE:
+        return estado, []
+    dist[s] = 0
+    state[s] = CINZA
+    fila = deque([s])
+    while fila:
+        u = fila.popleft()
+        if state[u] == PRETO:
+            continue
+        state[u] = PRETO
+        if parar_no_goal and u == g:
+            break
+        du = dist[u]
+        if offsets is None:
+            c = u % cols
+            vs = (u - cols if u >= cols else -1,
+                  u + cols if u < ultima_linha else -1,
+                  u - 1 if c > 0 else -1,
+                  u + 1 if c < cols - 1 else -1)
+        else:
+            vs = vizinhos[offsets[u]:offsets[u + 1]]
+        for v in vs:
+            if v < 0:
+                continue
+            sv = state[v]
+            if sv == PAREDE or sv == PRETO:
+                continue
+            w = custos[v] if custos is not None else 1
+            if dist[v] < 0 or du + w < dist[v]:
+                dist[v] = du + w
+                pred[v] = u
+                state[v] = CINZA
+                if w:
+                    fila.append(v)
+                else:
+                    fila.appendleft(v)
+
+    path = estado.path_to(goal)
+    return estado, path
+
+# ----------------------------------------------------
+# Dijkstra com baldes (algoritmo de Dial) para custos inteiros pequenos
+#   - Como nenhuma aresta custa mais que C = max(custos), as distâncias
+#     ainda abertas ficam sempre entre d e d + C: bastam C + 1 baldes
+#     (listas) usados em círculo, sem heap nem comparações
+#   - Entradas antigas (dist já melhorada) são puladas ao sair do balde
+# ----------------------------------------------------
+def dijkstra_dial(maze, start, goal, custos=None, parar_no_goal=False):
+    estado = GridState.from_maze(maze)
+    rows, cols = estado.rows, estado.cols
+    state, dist, pred = estado.state, estado.dist, estado.pred
+    custos = _custos_planos(maze, custos)
+    num_baldes = (max(custos, default=0) if custos is not None else 1) + 1
+    ultima_linha = (rows - 1) * cols
+    offsets = getattr(maze, 'offsets', None)   # GrafoCSR: vizinhos prontos
+    vizinhos = getattr(maze, 'vizinhos', None)
+
+    s = start[0] * cols + start[1]
+    g = goal[0] * cols + goal[1]
+    if state[s] == PAREDE or state[g] == PAREDE:
+        return estado, []
+    baldes = [[] for _ in range(num_baldes)]
+    dist[s] = 0
+    state[s] = CINZA
+    baldes[0].append(s)
+    pendentes = 1   # entradas em todos os baldes
+    d = 0
+    while pendentes:
+        balde = baldes[d % num_baldes]
+        # Custo 0 pode acrescentar nós ao próprio balde durante o laço
+        while balde:
+            u = balde.pop()
+            pendentes -= 1
+            if state[u] == PRETO or dist[u] != d:
+                continue
+            state[u] = PRETO
+            if parar_no_goal and u == g:
+                pendentes = 0
+                break
+            if offsets is None:
+                c = u % cols
+                vs = (u - cols if u >= cols else -1,
+                      u + cols if u < ultima_linha else -1,
+                      u - 1 if c > 0 else -1,
+                      u + 1 if c < cols - 1 else -1)
+            else:
+                vs = vizinhos[offsets[u]:offsets[u + 1]]
+            for v in vs:
+                if v < 0:
+                    continue
+                sv = state[v]
+                if sv == PAREDE or sv == PRETO:
+                    continue
+                dv = d + (custos[v] if custos is not None else 1)
+                if dist[v] < 0 or dv < dist[v]:
+                    dist[v] = dv
+                    pred[v] = u
+                    state[v] = CINZA
+                    baldes[dv % num_baldes].append(v)
+                    pendentes += 1
+        d += 1
+
+    path = estado.path_to(goal)
+    return estado, path
+
+# ----------------------------------------------------
+# Árvore de caminhos mínimos a partir de uma única origem
+#   - Um bfs completo na construção; depois, distância e caminho para
+#     qualquer quantidade de goals sem buscar de novo
+#   - k_nearest escolhe os k alvos mais próximos (ex.: pastilhas)
+#     pela distância já calculada
+# ----------------------------------------------------
+class ShortestPathTree:
+    def __init__(self, maze, source):
+        self.source = source
+        estado, _ = bfs(maze, source, source)
+        self.estado = estado
+        self.cols = estado.cols
+
+    def distance_to(self, goal):
+        """Número de passos da origem até goal, ou None se inalcançável."""
+        d = self.estado.dist[goal[0] * self.cols + goal[1]]
+        return d if d >= 0 else None
+
+    def path_to(self, goal):
+        return self.estado.path_to(goal)
+
+    def k_nearest(self, targets, k=1):
+        """Os k alvos alcançáveis mais próximos: [(distância, (r, c))], em ordem."""
+        dist, cols = self.estado.dist, self.cols
+        candidatos = []
+        for alvo in targets:
+            d = dist[alvo[0] * cols + alvo[1]]
+            if d >= 0:
+                candidatos.append((d, tuple(alvo)))
+        return heapq.nsmallest(k, candidatos)
+
+# ----------------------------------------------------
+# Interface comum: todos os motores recebem (maze, start, goal)
+# e devolvem (estado, path), então dá para trocar o motor por consulta.
+#
+# Com um índice de componentes (componentes.IndiceComponentes) do mesmo
+# labirinto, um goal inalcançável é rejeitado sem busca nenhuma: devolve
+# o estado inicial (nada explorado) e path vazio.
+# ----------------------------------------------------
+MOTORES = {
+    'bfs':              bfs,
+    'bfs_parar_no_goal': lambda maze, start, goal: bfs(maze, start, goal, parar_no_goal=True),
+    'bfs_bidirecional': bfs_bidirecional,
+    'astar':            astar,
+    'jps':              jps,
+    'bfs_01':           bfs_01,
+    'dijkstra_dial':    dijkstra_dial,
+}
+
+def resolver(maze, start, goal, motor='bfs', componentes=None):
+    if motor not in MOTORES:
+        raise ValueError("Motor desconhecido: %r (opções: %s)" % (motor, ", ".join(MOTORES)))
+    if componentes is not None and not componentes.alcancavel(start, goal):
+        return GridState.from_maze(maze), []
+    return MOTORES[motor](maze, start, goal)
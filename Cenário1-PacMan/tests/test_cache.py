@@ -0,0 +1,17 @@
+import maze_io
+from cache import CacheCamposDistancia, hash_labirinto
+
+def test_versao_nova_depois_de_mudar_o_labirinto():
+    maze = [[0, 0, 0], [0, 1, 0], [0, 0, 0]]
+    cache = CacheCamposDistancia()
+    assert cache.distancia(maze, (0, 0), (2, 2)) == 4
+    assert cache.distancia(maze, (0, 1), (2, 2)) == 3
+    assert (cache.acertos, cache.falhas) == (1, 1)
+    maze[1][0] = maze[0][1] = 1
+    assert cache.distancia(maze, (0, 0), (2, 2), versao=1) is None
+    assert cache.falhas == 2
+
+def test_hash_igual_para_lista_e_labirinto():
+    linhas = [[0, 0, 0], [0, 1, 0]]
+    lab = maze_io.Labirinto(2, 3, bytearray(b'\x00\x00\x00\x00\x01\x00'))
+    assert hash_labirinto(lab) == hash_labirinto(linhas)
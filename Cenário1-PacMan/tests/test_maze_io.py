@@ -0,0 +1,19 @@
+import pytest
+
+import maze_io
+
+LINHAS = [b'\x00\x00\x00', b'\x00\x01\x00']
+
+def test_close_com_linha_viva(tmp_path):
+    caminho = str(tmp_path / 'lab.bin')
+    maze_io.salvar_binario(caminho, LINHAS, 2, 3, (0, 0), (1, 2))
+    with maze_io.abrir_binario(caminho) as lab:
+        linha = lab[1]
+    assert bytes(linha) == LINHAS[1]   # a janela continua válida depois do close
+    lab.close()                        # segundo close: nada a fazer
+
+def test_cabecalho_truncado(tmp_path):
+    caminho = tmp_path / 'curto.bin'
+    caminho.write_bytes(maze_io.MAGICO + b'\x00' * 4)
+    with pytest.raises(ValueError):
+        maze_io.abrir_binario(str(caminho))
@@ -0,0 +1,22 @@
+import pytest
+
+import bfs_bitset  # registra 'bfs_bitset' em MOTORES
+from solver import MOTORES, resolver
+
+try:
+    import bfs_numpy  # registra 'bfs_numpy' (só com NumPy instalado)
+except ImportError:
+    pass
+
+MAZE = [
+    [0, 0, 0, 0],
+    [0, 1, 1, 0],
+    [0, 0, 0, 0],
+]
+
+@pytest.mark.parametrize('motor', sorted(MOTORES))
+def test_start_ou_goal_em_parede(motor):
+    assert resolver(MAZE, (1, 1), (0, 0), motor)[1] == []
+    assert resolver(MAZE, (0, 0), (1, 2), motor)[1] == []
+    path = resolver(MAZE, (0, 0), (2, 3), motor)[1]
+    assert path[0] == (0, 0) and path[-1] == (2, 3) and len(path) == 6
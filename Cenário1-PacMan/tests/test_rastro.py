@@ -0,0 +1,21 @@
+from rastro import Rastro, gravar_bfs
+
+MAZE = [
+    [0, 0, 0],
+    [0, 1, 0],
+    [0, 0, 0],
+]
+
+def test_start_em_parede_sem_eventos():
+    rastro, _, path = gravar_bfs(MAZE, (1, 1), (2, 2))
+    assert path == []
+    assert rastro.num_eventos == 0
+    assert rastro.estado_em(0) == rastro.inicial
+
+def test_salvar_e_carregar(tmp_path):
+    rastro, _, _ = gravar_bfs(MAZE, (0, 0), (2, 2))
+    caminho = str(tmp_path / 'busca.ras')
+    rastro.salvar(caminho)
+    lido = Rastro.carregar(caminho)
+    assert lido.eventos == rastro.eventos
+    assert lido.estado_em(lido.num_eventos) == rastro.estado_em(rastro.num_eventos)
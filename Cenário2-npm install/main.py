@@ -82,14 +82,16 @@ def draw_arrow(screen, start_pos, end_pos, color=(0, 0, 0), thickness=2, node_ra
 # Função de espera: prossegue quando a tecla seta → é pressionada
 # ----------------------------------------------------
 def wait_for_right_key():
-    waiting = True
-    while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_RIGHT:
-                waiting = False
+    # pygame.event.wait() bloqueia até o próximo evento (sem gastar CPU)
+    while True:
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            pygame.display.update()
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RIGHT:
+            return
 
 # ----------------------------------------------------
 # Função para desenhar a árvore de DFS
@@ -225,12 +227,13 @@ def main():
     visited, topo_order, predecessor, depth = dfs_topo_visual(screen)
     animate_installation(screen, topo_order)
     
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-        pygame.time.wait(50)
+    # Mantém a janela aberta, esperando eventos até o usuário fechar
+    while True:
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            break
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            pygame.display.update()
     pygame.quit()
     sys.exit()
 